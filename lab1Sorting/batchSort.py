@@ -0,0 +1,124 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Rows up to this width are sorted with a sorting network, wider ones with
+# np.sort. Past about 4-6 columns the network's O(w log^2 w) full-column passes
+# lose to np.sort's per-row insertion sort, even for 8-32 wide rows.
+NETWORK_MAX_WIDTH = 4
+
+_networks = {}
+
+
+def batch_sort_descending(rows):
+    """
+    Sorts every row of a 2D array (or list of equal-length rows) in place in
+    descending order with one vectorized call.
+
+    For a NumPy array with narrow rows, a fixed sorting network is applied
+    column-wise, so each compare-exchange step is a single np.maximum /
+    np.minimum over all rows at once. Wider rows, and float rows holding a
+    NaN, use np.sort along the rows (NaNs end up first).
+
+    Lists never go through the network: their rows are reordered in place
+    from one stable argsort over the batch, so they keep their element
+    types and equal elements keep their input order, as with
+    bubbleSortDescending. Without NumPy each row is sorted on its own.
+
+    Args:
+        rows: A 2D NumPy array or a list of equal-length lists.
+
+    Returns:
+        The sorted rows (the same object that was passed in).
+    """
+    if np is None:
+        for row in rows:
+            row.sort(reverse=True)
+        return rows
+
+    if isinstance(rows, np.ndarray):
+        rows[:] = _sorted_rows(rows)
+        return rows
+
+    if not rows:
+        return rows
+    # Only the positions come from NumPy; the rows keep their own elements,
+    # so ints stay ints even when another row (or cell) holds a float.
+    # Sorting each row reversed and reading the result backwards gives a
+    # descending order in which equal elements keep their input order.
+    width = len(rows[0])
+    order = width - 1 - np.argsort(np.array(rows)[:, ::-1], axis=1, kind="stable")[:, ::-1]
+    for row, positions in zip(rows, order.tolist()):
+        row[:] = [row[i] for i in positions]
+    return rows
+
+
+def sorting_network(width):
+    """
+    Builds Batcher's odd-even merge sorting network for a given width.
+
+    The network is generated for the next power of two and comparators that
+    touch the padding are dropped; the padding would only ever hold values
+    smaller than everything else, so those comparators never swap.
+
+    Args:
+        width (int): Number of elements the network sorts.
+
+    Returns:
+        list: (i, j) comparator pairs with i < j, in the order they are applied.
+    """
+    if width not in _networks:
+        size = 1
+        while size < width:
+            size *= 2
+        pairs = []
+        p = 1
+        while p < size:
+            k = p
+            while k >= 1:
+                for j in range(k % p, size - k, 2 * k):
+                    for i in range(min(k, size - j - k)):
+                        if (i + j) // (2 * p) == (i + j + k) // (2 * p):
+                            pairs.append((i + j, i + j + k))
+                k //= 2
+            p *= 2
+        _networks[width] = [(i, j) for i, j in pairs if j < width]
+    return _networks[width]
+
+
+def _sorted_rows(values):
+    width = values.shape[1] if values.ndim == 2 else 0
+    if width < 2:
+        return values
+    if width > NETWORK_MAX_WIDTH:
+        return np.sort(values, axis=1)[:, ::-1]
+    if values.dtype.kind == "f":
+        # np.maximum / np.minimum would spread a NaN over its whole row, so
+        # those rows go to np.sort, which puts NaNs first when reversed
+        nanRows = np.isnan(values).any(axis=1)
+        if nanRows.any():
+            result = np.empty_like(values)
+            result[nanRows] = np.sort(values[nanRows], axis=1)[:, ::-1]
+            result[~nanRows] = _network_sorted(values[~nanRows], width)
+            return result
+    return _network_sorted(values, width)
+
+
+def _network_sorted(values, width):
+    # Work column by column: transposed and contiguous, each column is one
+    # contiguous vector over all rows
+    columns = np.ascontiguousarray(values.T)
+    high = np.empty_like(columns[0])
+    for i, j in sorting_network(width):
+        np.maximum(columns[i], columns[j], out=high)
+        np.minimum(columns[i], columns[j], out=columns[j])
+        columns[i] = high
+    return columns.T
+
+
+# Example usage:
+if __name__ == "__main__":
+    myRows = [[64, 34, 25, 12, 22, 11, 90, 5],
+              [3, 1, 4, 1, 5, 9, 2, 6]]
+    print(f"Sorted rows (descending): {batch_sort_descending(myRows)}")
@@ -0,0 +1,49 @@
+import random
+import time
+
+from batchSort import batch_sort_descending, np
+from bub import bubbleSortDescending
+
+
+def throughput(rowCount, width, seed=1240):
+    """
+    Compares rows sorted per second by batch_sort_descending (on a list of
+    rows and on a 2D NumPy array) against calling bubbleSortDescending on
+    each row in a loop.
+
+    Args:
+        rowCount (int): Number of rows to sort.
+        width (int): Length of each row.
+        seed (int): Seed for the random generator so runs are repeatable.
+
+    Returns:
+        tuple: (loop, batch on lists, batch on an array) rows per second.
+    """
+    rng = random.Random(seed)
+    rows = [[rng.randint(0, 1000) for _ in range(width)] for _ in range(rowCount)]
+
+    loopRows = [row[:] for row in rows]
+    startTime = time.perf_counter()
+    for row in loopRows:
+        bubbleSortDescending(row)
+    loopRate = rowCount / (time.perf_counter() - startTime)
+
+    batchRows = [row[:] for row in rows]
+    startTime = time.perf_counter()
+    batch_sort_descending(batchRows)
+    batchRate = rowCount / (time.perf_counter() - startTime)
+
+    assert batchRows == loopRows
+
+    table = np.array(rows)
+    startTime = time.perf_counter()
+    batch_sort_descending(table)
+    arrayRate = rowCount / (time.perf_counter() - startTime)
+    return loopRate, batchRate, arrayRate
+
+
+if __name__ == "__main__":
+    print(f"{'width':>6} {'loop rows/s':>14} {'list rows/s':>14} {'array rows/s':>14} {'speedup':>8}")
+    for width in [4, 8, 16, 32]:
+        loopRate, batchRate, arrayRate = throughput(200000, width)
+        print(f"{width:>6} {loopRate:14,.0f} {batchRate:14,.0f} {arrayRate:14,.0f} {arrayRate / loopRate:8.1f}")
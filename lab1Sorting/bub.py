@@ -21,7 +21,8 @@ def bubbleSortDescending(arr):
     return arr
 
 # Example usage:
-myList = [64, 34, 25, 12, 22, 11, 90]
-sortedList = bubbleSortDescending(myList)
-print(f"Original list: {myList}")
-print(f"Sorted list (descending): {sortedList}")
\ No newline at end of file
+if __name__ == "__main__":
+    myList = [64, 34, 25, 12, 22, 11, 90]
+    sortedList = bubbleSortDescending(myList)
+    print(f"Original list: {myList}")
+    print(f"Sorted list (descending): {sortedList}")
\ No newline at end of file
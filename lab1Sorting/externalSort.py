@@ -0,0 +1,244 @@
+import heapq
+import itertools
+import os
+import struct
+import sys
+import tempfile
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024  # bytes
+MIN_BLOCK_BYTES = 64 * 1024               # smallest read buffer per run while merging
+
+
+def external_sort_descending(source, output, fmt="q", key=None,
+                             memory_budget=DEFAULT_MEMORY_BUDGET, tmp_dir=None):
+    """
+    Sorts data that may not fit in memory in descending order and writes it
+    to a binary file.
+
+    Args:
+        source: An iterable of records, or the path of a binary file of
+                records packed with fmt.
+        output: Path or writable binary file object for the sorted records.
+        fmt (str): struct format of one record, e.g. 'q' for int64 or 'qd'
+                   for an (int64, float) pair. Single-field formats give plain
+                   values, multi-field formats give tuples.
+        key: Optional function of one argument used to extract the value
+             each record is compared by.
+        memory_budget (int): Approximate number of bytes the sort may hold
+                             in memory at once.
+        tmp_dir (str): Directory for the spilled runs (system default if None).
+
+    Returns:
+        int: The number of records written.
+    """
+    recordStruct = struct.Struct(fmt)
+    count = 0
+    with _open_output(output) as out:
+        for block in _batched(iter_external_sort_descending(source, fmt, key, memory_budget, tmp_dir),
+                              max(1, MIN_BLOCK_BYTES // recordStruct.size)):
+            out.write(_pack_block(recordStruct, block))
+            count += len(block)
+    return count
+
+
+def iter_external_sort_descending(source, fmt="q", key=None,
+                                  memory_budget=DEFAULT_MEMORY_BUDGET, tmp_dir=None):
+    """
+    Generator version of external_sort_descending that yields the sorted
+    records instead of writing them.
+
+    The input is read in chunks sized to the memory budget; each chunk is
+    sorted and spilled to a temporary file as packed binary records. The
+    runs are then k-way merged with a heap. If there are more runs than the
+    budget allows read buffers for, they are merged in several passes.
+    Equal records keep their input order, as in bubbleSortDescending.
+
+    Args:
+        source: An iterable of records, or the path of a binary file of
+                records packed with fmt.
+        fmt (str): struct format of one record.
+        key: Optional function of one argument used to extract the value
+             each record is compared by.
+        memory_budget (int): Approximate number of bytes held in memory.
+        tmp_dir (str): Directory for the spilled runs.
+
+    Yields:
+        The records in descending order.
+    """
+    recordStruct = struct.Struct(fmt)
+    if isinstance(source, (str, os.PathLike)):
+        source = read_records(source, fmt)
+    records = iter(source)
+
+    first = next(records, None)
+    if first is None:
+        return
+    records = itertools.chain([first], records)
+
+    # Each in-memory record costs its object(s) plus a list slot
+    itemBytes = _object_size(first) + 8
+    chunkSize = max(1, memory_budget // itemBytes)
+    maxFanIn = max(2, memory_budget // MIN_BLOCK_BYTES)
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as workDir:
+        runPaths = []
+        for chunk in _batched(records, chunkSize):
+            # A single chunk never needs to touch the disk
+            if not runPaths and len(chunk) < chunkSize:
+                chunk.sort(key=key, reverse=True)
+                yield from chunk
+                return
+            chunk.sort(key=key, reverse=True)
+            runPaths.append(_write_run(workDir, len(runPaths), recordStruct, chunk))
+            del chunk
+
+        # Merge passes until the remaining runs fit in one merge
+        while len(runPaths) > maxFanIn:
+            merged = []
+            for start in range(0, len(runPaths), maxFanIn):
+                group = runPaths[start:start + maxFanIn]
+                path = os.path.join(workDir, f"pass{len(runPaths)}_{start}.bin")
+                with open(path, "wb") as out:
+                    for block in _batched(_merge_runs(group, recordStruct, key, memory_budget),
+                                          max(1, MIN_BLOCK_BYTES // recordStruct.size)):
+                        out.write(_pack_block(recordStruct, block))
+                for oldPath in group:
+                    os.remove(oldPath)
+                merged.append(path)
+            runPaths = merged
+
+        yield from _merge_runs(runPaths, recordStruct, key, memory_budget)
+
+
+def read_records(path, fmt="q", block_bytes=MIN_BLOCK_BYTES):
+    """
+    Reads packed binary records from a file one block at a time.
+
+    Args:
+        path: The file to read.
+        fmt (str): struct format of one record.
+        block_bytes (int): Approximate size of each read.
+
+    Yields:
+        A value per record for single-field formats, otherwise a tuple.
+    """
+    recordStruct = struct.Struct(fmt)
+    with open(path, "rb") as f:
+        yield from _read_blocks(f, recordStruct, block_bytes)
+
+
+def write_records(path, records, fmt="q"):
+    """
+    Writes records to a file in the packed binary format used by the sort.
+
+    Args:
+        path: The file to write.
+        records: An iterable of values (single-field fmt) or tuples.
+        fmt (str): struct format of one record.
+
+    Returns:
+        int: The number of records written.
+    """
+    recordStruct = struct.Struct(fmt)
+    count = 0
+    with open(path, "wb") as out:
+        for block in _batched(records, max(1, MIN_BLOCK_BYTES // recordStruct.size)):
+            out.write(_pack_block(recordStruct, block))
+            count += len(block)
+    return count
+
+
+def _merge_runs(runPaths, recordStruct, key, memory_budget):
+    # Split the budget evenly between the read buffers of the runs
+    blockBytes = max(recordStruct.size, memory_budget // (len(runPaths) + 1))
+    files = [open(path, "rb") for path in runPaths]
+    try:
+        readers = [_read_blocks(f, recordStruct, blockBytes) for f in files]
+        # heapq.merge keeps a heap of one head record per run and, on ties,
+        # prefers earlier runs, so the merge is stable
+        yield from heapq.merge(*readers, key=key, reverse=True)
+    finally:
+        for f in files:
+            f.close()
+
+
+def _read_blocks(f, recordStruct, blockBytes):
+    size = recordStruct.size
+    readBytes = max(size, blockBytes - blockBytes % size)
+    single = len(recordStruct.unpack(bytes(size))) == 1
+    while True:
+        data = f.read(readBytes)
+        if not data:
+            return
+        if single:
+            for (value,) in recordStruct.iter_unpack(data):
+                yield value
+        else:
+            yield from recordStruct.iter_unpack(data)
+
+
+def _write_run(workDir, index, recordStruct, chunk):
+    path = os.path.join(workDir, f"run{index}.bin")
+    with open(path, "wb") as out:
+        step = max(1, MIN_BLOCK_BYTES // recordStruct.size)
+        for start in range(0, len(chunk), step):
+            out.write(_pack_block(recordStruct, chunk[start:start + step]))
+    return path
+
+
+def _pack_block(recordStruct, block):
+    if block and isinstance(block[0], tuple):
+        return b"".join([recordStruct.pack(*record) for record in block])
+    return b"".join([recordStruct.pack(record) for record in block])
+
+
+def _batched(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _object_size(record):
+    if isinstance(record, tuple):
+        return sys.getsizeof(record) + sum(sys.getsizeof(field) for field in record)
+    return sys.getsizeof(record)
+
+
+def _open_output(output):
+    if isinstance(output, (str, os.PathLike)):
+        return open(output, "wb")
+    # Caller owns the file object; don't close it on their behalf
+    return _NoClose(output)
+
+
+class _NoClose:
+    def __init__(self, f):
+        self._f = f
+
+    def __enter__(self):
+        return self._f
+
+    def __exit__(self, *exc):
+        self._f.flush()
+        return False
+
+
+# Example usage:
+if __name__ == "__main__":
+    import random
+
+    workDir = tempfile.mkdtemp()
+    inputPath = os.path.join(workDir, "scores.bin")
+    outputPath = os.path.join(workDir, "sorted.bin")
+
+    scores = [random.randint(0, 1000000) for _ in range(200000)]
+    write_records(inputPath, scores)
+
+    # A 1 MB budget forces the sort to spill and merge runs
+    count = external_sort_descending(inputPath, outputPath, memory_budget=1024 * 1024)
+    result = list(read_records(outputPath))
+    print(f"Sorted {count} records, first ten: {result[:10]}")
+    print(f"Matches sorted(): {result == sorted(scores, reverse=True)}")
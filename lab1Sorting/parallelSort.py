@@ -0,0 +1,281 @@
+import array
+import heapq
+import os
+from multiprocessing import Pool, shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Below this many elements per worker the process start-up costs more than it saves
+MIN_PER_WORKER = 50000
+SAMPLES_PER_RUN = 64
+
+
+def parallel_sort_descending(arr, workers=None, key=None):
+    """
+    Sorts a list, array.array or NumPy array in place in descending order
+    using a pool of worker processes.
+
+    The input is split into one partition per worker and each worker sorts
+    its partition. The sorted partitions are then cut at common splitter
+    values so that each worker can merge its own slice of the output
+    independently (a parallel multiway merge). Integer and float data is
+    moved through shared memory instead of being pickled; other data (or
+    the keys, when a key function is given) is sent to the pool pickled.
+
+    Args:
+        arr: The sequence to be sorted.
+        workers (int): Number of worker processes (all CPUs if None).
+        key: Optional function of one argument used to extract the value
+             each element is compared by. Keys are computed in the parent
+             process and must be picklable.
+
+    Returns:
+        The sorted sequence (the same object that was passed in).
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    n = len(arr)
+    workers = max(1, min(workers, n // MIN_PER_WORKER))
+
+    typecode = _numeric_typecode(arr) if key is None else None
+    if workers == 1:
+        _sort_in_place(arr, key)
+    elif typecode is not None:
+        _shared_sort(arr, typecode, workers)
+    else:
+        _pickled_sort(arr, workers, key)
+    return arr
+
+
+def _numeric_typecode(arr):
+    # Decide whether the data can travel as a flat int64/float64 buffer
+    if isinstance(arr, array.array):
+        return arr.typecode if arr.typecode in ("q", "d") else None
+    if np is not None and isinstance(arr, np.ndarray):
+        if arr.dtype == np.int64:
+            return "q"
+        if arr.dtype == np.float64:
+            return "d"
+        return None
+    if isinstance(arr, list) and arr:
+        if all(type(item) is int for item in arr):
+            if -2 ** 63 <= min(arr) and max(arr) < 2 ** 63:
+                return "q"
+            return None
+        if all(type(item) is float for item in arr):
+            return "d"
+    return None
+
+
+def _sort_in_place(arr, key=None):
+    if np is not None and isinstance(arr, array.array) and key is None and arr.typecode in ("q", "d"):
+        # Sort the array's own buffer without copying it into Python objects
+        arr = np.frombuffer(arr, dtype=_dtype(arr.typecode))
+    if np is not None and isinstance(arr, np.ndarray):
+        if key is None:
+            arr.sort()
+            arr[:] = arr[::-1].copy()
+        else:
+            # NumPy can't sort by a key function; reverse=True keeps equal
+            # keys in their original order, as the worker path does
+            order = sorted(range(len(arr)), key=lambda i: key(arr[i]), reverse=True)
+            arr[:] = arr[order]
+    elif isinstance(arr, list):
+        arr.sort(key=key, reverse=True)
+    else:
+        arr[:] = type(arr)(arr.typecode, sorted(arr, key=key, reverse=True))
+
+
+def _partition_bounds(n, parts):
+    return [n * p // parts for p in range(parts + 1)]
+
+
+def _shared_sort(arr, typecode, workers):
+    n = len(arr)
+    itemSize = array.array(typecode).itemsize
+    source = shared_memory.SharedMemory(create=True, size=n * itemSize)
+    target = shared_memory.SharedMemory(create=True, size=n * itemSize)
+    try:
+        _copy_in(source, arr, typecode)
+
+        bounds = _partition_bounds(n, workers)
+        runs = list(zip(bounds, bounds[1:]))
+        with Pool(workers) as pool:
+            # Phase 1: sort each partition in place in the shared buffer
+            pool.starmap(_sort_shared_range, [(source.name, typecode, lo, hi) for lo, hi in runs])
+
+            # Phase 2: cut every run at the same splitter values, then merge
+            cuts = _split_runs(source, typecode, runs, workers)
+            tasks = []
+            outStart = 0
+            for p in range(workers):
+                pieces = [(cuts[r][p], cuts[r][p + 1]) for r in range(len(runs))]
+                size = sum(hi - lo for lo, hi in pieces)
+                tasks.append((source.name, target.name, typecode, pieces, outStart))
+                outStart += size
+            pool.starmap(_merge_shared_pieces, tasks)
+
+        _copy_out(target, arr, typecode)
+    finally:
+        for block in (source, target):
+            block.close()
+            block.unlink()
+
+
+def _copy_in(block, arr, typecode):
+    # The segment may be rounded up to a whole page, so only touch n items
+    if np is not None and isinstance(arr, np.ndarray):
+        # NumPy copies strided views (such as a[::2]) that memoryview can't cast
+        shared = np.frombuffer(block.buf, dtype=_dtype(typecode), count=len(arr))
+        shared[:] = arr
+        del shared
+        return
+    if isinstance(arr, list):
+        arr = array.array(typecode, arr)
+    data = memoryview(arr).cast("B")
+    block.buf[:len(data)] = data
+    data.release()
+
+
+def _copy_out(block, arr, typecode):
+    view = block.buf.cast(typecode)[:len(arr)]
+    try:
+        if isinstance(arr, list):
+            arr[:] = view.tolist()
+        elif isinstance(arr, array.array):
+            arr[:] = array.array(typecode, view.tobytes())
+        else:
+            arr[:] = np.frombuffer(view, dtype=arr.dtype)
+    finally:
+        view.release()
+
+
+def _split_runs(source, typecode, runs, parts):
+    """
+    Picks parts - 1 splitter values from a sample of every sorted run and
+    returns, for each run, the absolute positions where it is cut.
+    """
+    view = source.buf.cast(typecode)
+    try:
+        sample = []
+        for lo, hi in runs:
+            step = max(1, (hi - lo) // SAMPLES_PER_RUN)
+            sample.extend(view[i] for i in range(lo, hi, step))
+        sample.sort(reverse=True)
+        splitters = [sample[len(sample) * p // parts] for p in range(1, parts)]
+
+        cuts = []
+        for lo, hi in runs:
+            # Partition p takes the values v with splitters[p-1] >= v > splitters[p]
+            runCuts = [lo] + [_count_greater(view, lo, hi, s) for s in splitters] + [hi]
+            cuts.append(runCuts)
+        return cuts
+    finally:
+        view.release()
+
+
+def _count_greater(view, lo, hi, value):
+    # Binary search in a descending range: first index whose value is <= value
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if view[mid] > value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _sort_shared_range(name, typecode, lo, hi):
+    block = shared_memory.SharedMemory(name=name)
+    view = block.buf.cast(typecode)
+    try:
+        if np is not None:
+            segment = np.frombuffer(view, dtype=_dtype(typecode))[lo:hi]
+            segment.sort()
+            segment[:] = segment[::-1].copy()
+            del segment
+        else:
+            values = sorted(view[lo:hi], reverse=True)
+            view[lo:hi] = array.array(typecode, values)
+    finally:
+        view.release()
+        block.close()
+
+
+def _merge_shared_pieces(sourceName, targetName, typecode, pieces, outStart):
+    source = shared_memory.SharedMemory(name=sourceName)
+    target = shared_memory.SharedMemory(name=targetName)
+    inView = source.buf.cast(typecode)
+    outView = target.buf.cast(typecode)
+    try:
+        size = sum(hi - lo for lo, hi in pieces)
+        if np is not None:
+            merged = np.concatenate([np.frombuffer(inView, dtype=_dtype(typecode))[lo:hi] for lo, hi in pieces])
+            merged.sort(kind="stable")
+            np.frombuffer(outView, dtype=_dtype(typecode))[outStart:outStart + size] = merged[::-1]
+            del merged
+        else:
+            merged = heapq.merge(*[inView[lo:hi].tolist() for lo, hi in pieces], reverse=True)
+            outView[outStart:outStart + size] = array.array(typecode, merged)
+    finally:
+        inView.release()
+        outView.release()
+        source.close()
+        target.close()
+
+
+def _dtype(typecode):
+    return np.int64 if typecode == "q" else np.float64
+
+
+def _pickled_sort(arr, workers, key):
+    items = list(arr)
+    if key is not None:
+        # Only the keys travel to the workers, so key functions such as
+        # lambdas don't need to be picklable; -index keeps equal keys stable
+        work = [(key(items[i]), -i) for i in range(len(items))]
+    else:
+        work = items
+    bounds = _partition_bounds(len(work), workers)
+    partitions = [work[lo:hi] for lo, hi in zip(bounds, bounds[1:])]
+    with Pool(workers) as pool:
+        runs = pool.map(_sorted_descending, partitions)
+    merged = list(heapq.merge(*runs, reverse=True))
+    if key is not None:
+        merged = [items[-negIndex] for _, negIndex in merged]
+    if isinstance(arr, array.array):
+        arr[:] = array.array(arr.typecode, merged)
+    else:
+        arr[:] = merged
+
+
+def _sorted_descending(part):
+    part.sort(reverse=True)
+    return part
+
+
+# Example usage:
+if __name__ == "__main__":
+    import random
+
+    myList = [random.randint(0, 1000) for _ in range(200000)]
+    expected = sorted(myList, reverse=True)
+    parallel_sort_descending(myList, workers=4)
+    print(f"First ten (descending): {myList[:10]}")
+    print(f"Matches sorted(): {myList == expected}")
+
+    if np is not None:
+        # One worker and several workers must agree when sorting by a key
+        values = np.array([random.randint(-1000, 1000) for _ in range(200000)])
+        single = parallel_sort_descending(values.copy(), workers=1, key=abs)
+        multiple = parallel_sort_descending(values.copy(), workers=4, key=abs)
+        print(f"Key sort, 1 worker matches 4 workers: {np.array_equal(single, multiple)}")
+
+        # Strided views go through shared memory too when there are several workers
+        strided = np.array([random.randint(-1000, 1000) for _ in range(400000)])
+        expected = np.sort(strided[::2])[::-1]
+        parallel_sort_descending(strided[::2], workers=4)
+        print(f"Strided view sorted with 4 workers: {np.array_equal(strided[::2], expected)}")
@@ -0,0 +1,39 @@
+import array
+import os
+import random
+import sys
+import time
+
+from parallelSort import parallel_sort_descending
+
+
+def scaling_benchmark(n, maxWorkers, seed=1240):
+    """
+    Times parallel_sort_descending on the same float64 array with 1 to
+    maxWorkers worker processes.
+
+    Args:
+        n (int): Number of elements to sort.
+        maxWorkers (int): Largest worker count to try.
+        seed (int): Seed for the random generator so runs are repeatable.
+    """
+    rng = random.Random(seed)
+    data = array.array("d", (rng.random() for _ in range(n)))
+    print(f"Sorting {n} float64 values on {os.cpu_count()} CPU(s)")
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8}")
+    baseline = None
+    for workers in range(1, maxWorkers + 1):
+        copy = array.array("d", data)
+        startTime = time.perf_counter()
+        parallel_sort_descending(copy, workers=workers)
+        elapsed = time.perf_counter() - startTime
+        if baseline is None:
+            baseline = elapsed
+        print(f"{workers:>8} {elapsed:10.3f} {baseline / elapsed:8.2f}")
+
+
+if __name__ == "__main__":
+    # Usage: python parallelSortBenchmark.py [n] [max workers]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    maxWorkers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    scaling_benchmark(n, maxWorkers)
@@ -0,0 +1,175 @@
+import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RADIX_BITS = 8              # bits per LSD pass (256 buckets); at most 8
+COUNTING_RANGE_FACTOR = 2   # counting sort while (max - min + 1) <= factor * n
+COUNTING_RANGE_MIN = 1 << 16
+
+
+def integer_sort_descending(arr):
+    """
+    Sorts integers in place in descending order without comparisons.
+
+    Uses counting sort when the range of values is small compared with the
+    number of elements and LSD radix sort otherwise, so the running time is
+    linear in the length of the input either way.
+
+    Args:
+        arr: A list of ints, an integer array.array or an integer NumPy array.
+
+    Returns:
+        The sorted sequence (the same object that was passed in).
+    """
+    if len(arr) < 2:
+        return arr
+    low, high = _min_max(arr)
+    if high - low + 1 <= max(COUNTING_RANGE_MIN, COUNTING_RANGE_FACTOR * len(arr)):
+        return counting_sort_descending(arr, low, high)
+    return radix_sort_descending(arr, low, high)
+
+
+def counting_sort_descending(arr, low=None, high=None):
+    """
+    Sorts integers in place in descending order with a counting sort.
+
+    Args:
+        arr: A list of ints, an integer array.array or an integer NumPy array.
+        low (int): Smallest value in arr (computed if not given).
+        high (int): Largest value in arr (computed if not given).
+
+    Returns:
+        The sorted sequence (the same object that was passed in).
+    """
+    if len(arr) < 2:
+        return arr
+    if low is None or high is None:
+        low, high = _min_max(arr)
+
+    values = _as_numpy(arr)
+    if values is not None:
+        # Subtract in int64: in a narrow signed dtype such as int8, value - low
+        # overflows (-100 - 100 wraps around). Unsigned values never go below low.
+        if values.dtype.kind == "u":
+            shifted = values - values.dtype.type(low)
+        else:
+            shifted = np.subtract(values, low, dtype=np.int64)
+        counts = np.bincount(shifted.astype(np.intp), minlength=high - low + 1)
+        # Walk the counts from the top value down
+        offsets = np.repeat(np.arange(high - low, -1, -1, dtype=np.int64), counts[::-1])
+        values[:] = _wrap_add(offsets, low).astype(values.dtype)
+        return arr
+
+    counts = [0] * (high - low + 1)
+    for value in arr:
+        counts[value - low] += 1
+    position = 0
+    for offset in range(high - low, -1, -1):
+        count = counts[offset]
+        if count:
+            arr[position:position + count] = _fill(arr, low + offset, count)
+            position += count
+    return arr
+
+
+def radix_sort_descending(arr, low=None, high=None):
+    """
+    Sorts integers in place in descending order with an LSD radix sort.
+
+    Each value x is mapped to the non-negative key high - x, so that sorting
+    the keys in ascending order gives the values in descending order and
+    negative numbers need no special handling. The keys are then sorted
+    RADIX_BITS bits at a time, least significant digit first, with a stable
+    bucket pass per digit.
+
+    Args:
+        arr: A list of ints, an integer array.array or an integer NumPy array.
+        low (int): Smallest value in arr (computed if not given).
+        high (int): Largest value in arr (computed if not given).
+
+    Returns:
+        The sorted sequence (the same object that was passed in).
+    """
+    if len(arr) < 2:
+        return arr
+    if low is None or high is None:
+        low, high = _min_max(arr)
+    passes = max(1, -(-(high - low).bit_length() // RADIX_BITS))
+    mask = (1 << RADIX_BITS) - 1
+
+    values = _as_numpy(arr)
+    if values is not None:
+        keys = _wrap_add(-values.astype(np.uint64), high)
+        for digit in range(passes):
+            digits = ((keys >> np.uint64(digit * RADIX_BITS)) & np.uint64(mask)).astype(np.uint8)
+            # A stable sort of 8-bit digits is a counting sort in NumPy
+            keys = keys[np.argsort(digits, kind="stable")]
+        values[:] = _wrap_add(-keys, high).astype(values.dtype)
+        return arr
+
+    keys = [high - value for value in arr]
+    for digit in range(passes):
+        shift = digit * RADIX_BITS
+        buckets = [[] for _ in range(mask + 1)]
+        for key in keys:
+            buckets[(key >> shift) & mask].append(key)
+        keys = [key for bucket in buckets for key in bucket]
+    arr[:] = _from_list(arr, [high - key for key in keys])
+    return arr
+
+
+def _min_max(arr):
+    values = _as_numpy(arr)
+    if values is not None:
+        return int(values.min()), int(values.max())
+    return min(arr), max(arr)
+
+
+def _wrap_add(values, number):
+    # uint64 arithmetic modulo 2**64: exact whenever the true result fits the
+    # target dtype, which lets signed and unsigned inputs share one code path
+    return values.astype(np.uint64) + np.uint64(number % 2 ** 64)
+
+
+def _as_numpy(arr):
+    # NumPy view over the caller's buffer, or None for the pure Python path
+    if np is None:
+        return None
+    if isinstance(arr, np.ndarray):
+        return arr
+    if isinstance(arr, array.array):
+        return np.frombuffer(arr, dtype=np.dtype(arr.typecode))
+    return None
+
+
+def _fill(arr, value, count):
+    if isinstance(arr, array.array):
+        return array.array(arr.typecode, [value]) * count
+    return [value] * count
+
+
+def _from_list(arr, values):
+    if isinstance(arr, array.array):
+        return array.array(arr.typecode, values)
+    return values
+
+
+# Example usage:
+if __name__ == "__main__":
+    myList = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Counting sort (descending): {integer_sort_descending(myList)}")
+
+    wideList = [64, -34, 25000000, 12, 2 ** 40, 11, -90]
+    print(f"Radix sort (descending): {integer_sort_descending(wideList)}")
+
+    # Narrow signed types, where value - low overflows the type itself
+    bytesArray = array.array('b', [-100, 100, 5])
+    print(f"int8 array.array (descending): {integer_sort_descending(bytesArray).tolist()}")
+    shortsArray = array.array('h', [-30000, 30000, 7])
+    print(f"int16 array.array (descending): {integer_sort_descending(shortsArray).tolist()}")
+    if np is not None:
+        int8Values = np.array([-128, 127, 0, -1], dtype=np.int8)
+        print(f"int8 NumPy array (descending): {integer_sort_descending(int8Values).tolist()}")
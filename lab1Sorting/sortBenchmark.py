@@ -0,0 +1,67 @@
+import random
+import time
+
+from bub import bubbleSortDescending
+from sortEngine import sort_descending, choose_strategy
+
+# bubbleSortDescending is O(n^2), so it is only timed up to this size
+BUBBLE_LIMIT = 2000
+
+
+def make_inputs(n, seed=1240):
+    """
+    Builds the benchmark inputs of a given size.
+
+    Args:
+        n (int): Number of elements in each input.
+        seed (int): Seed for the random generator so runs are repeatable.
+
+    Returns:
+        dict: Input name -> list of integers.
+    """
+    rng = random.Random(seed)
+    return {
+        "random": [rng.randint(0, n * 10) for _ in range(n)],
+        "sorted": list(range(n, 0, -1)),
+        "reversed": list(range(n)),
+        "few-unique": [rng.randint(0, 4) for _ in range(n)],
+    }
+
+
+def time_sort(sort_function, data):
+    """
+    Times a single sort of a copy of data.
+
+    Args:
+        sort_function: Function that sorts a list in place, descending.
+        data (list): The input to sort.
+
+    Returns:
+        float: Elapsed time in milliseconds.
+    """
+    copy = data[:]
+    startTime = time.perf_counter()
+    sort_function(copy)
+    endTime = time.perf_counter()
+    return (endTime - startTime) * 1000
+
+
+def builtin_sorted(data):
+    return sorted(data, reverse=True)
+
+
+def run_benchmark(sizes):
+    print(f"{'n':>8} {'input':>11} {'strategy':>10} {'bubble':>10} {'engine':>10} {'sorted()':>10}   (ms)")
+    for n in sizes:
+        for name, data in make_inputs(n).items():
+            if n <= BUBBLE_LIMIT:
+                bubble = f"{time_sort(bubbleSortDescending, data):10.2f}"
+            else:
+                bubble = f"{'--':>10}"
+            engine = time_sort(sort_descending, data)
+            builtin = time_sort(builtin_sorted, data)
+            print(f"{n:>8} {name:>11} {choose_strategy(data):>10} {bubble} {engine:10.2f} {builtin:10.2f}")
+
+
+if __name__ == "__main__":
+    run_benchmark([100, 2000, 20000, 200000])
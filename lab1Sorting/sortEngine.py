@@ -0,0 +1,242 @@
+SMALL_SORT = 32     # lists/partitions at or below this size use insertion sort
+MIN_RUN = 32        # short natural runs are extended to this length
+RUN_RATIO = 64      # "mostly sorted" means at most n / RUN_RATIO natural runs
+
+
+def sort_descending(arr, key=None):
+    """
+    Sorts a list in place in descending order, picking a strategy from the
+    size and presortedness of the input.
+
+    Tiny lists use an early-exit insertion sort. Larger lists are scanned
+    once for natural runs: mostly-sorted input is finished with a
+    run-merging merge sort, everything else with an introsort (quicksort
+    with a heapsort fallback). Like bubbleSortDescending, equal elements
+    keep their original order whenever a key is given.
+
+    Args:
+        arr: The list to be sorted.
+        key: Optional function of one argument used to extract the value
+             each element is compared by.
+
+    Returns:
+        The sorted list (the same object that was passed in).
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    if key is None:
+        _sort_items(arr)
+        return arr
+
+    # Decorate with (key, -index): every item is unique and ties fall back to
+    # the original order, so even the unstable strategies give a stable result
+    decorated = [(key(arr[i]), -i) for i in range(n)]
+    _sort_items(decorated)
+    original = arr[:]
+    arr[:] = [original[-negIndex] for _, negIndex in decorated]
+    return arr
+
+
+def choose_strategy(arr):
+    """
+    Reports which strategy sort_descending would use, without sorting.
+
+    Args:
+        arr: The list to inspect.
+
+    Returns:
+        One of 'insertion', 'merge' or 'introsort'.
+    """
+    n = len(arr)
+    if n <= SMALL_SORT:
+        return "insertion"
+    runs = _count_runs(arr)
+    return "merge" if runs <= max(1, n // RUN_RATIO) else "introsort"
+
+
+def _sort_items(a):
+    strategy = choose_strategy(a)
+    n = len(a)
+    if strategy == "insertion":
+        _insertion_sort(a, 0, n)
+    elif strategy == "merge":
+        _merge_runs(a, _find_runs(a))
+    else:
+        _introsort(a, 0, n, 2 * n.bit_length())
+
+
+def _count_runs(a):
+    # Counts maximal non-increasing / strictly increasing stretches
+    n = len(a)
+    runs = 0
+    i = 0
+    while i < n:
+        runs += 1
+        j = i + 1
+        if j < n and a[i] < a[j]:
+            while j < n and a[j - 1] < a[j]:
+                j += 1
+        else:
+            while j < n and not a[j - 1] < a[j]:
+                j += 1
+        i = j
+    return runs
+
+
+def _find_runs(a):
+    """
+    Splits the list into descending runs of at least MIN_RUN elements.
+
+    Strictly ascending stretches are reversed in place (strictness keeps the
+    reversal stable) and short runs are extended with insertion sort.
+    """
+    n = len(a)
+    runs = []
+    i = 0
+    while i < n:
+        j = i + 1
+        if j < n and a[i] < a[j]:
+            while j < n and a[j - 1] < a[j]:
+                j += 1
+            a[i:j] = a[i:j][::-1]
+        else:
+            while j < n and not a[j - 1] < a[j]:
+                j += 1
+        if j - i < MIN_RUN:
+            end = min(n, i + MIN_RUN)
+            _insertion_sort(a, i, end, j)
+            j = end
+        runs.append(j)
+        i = j
+    return runs
+
+
+def _insertion_sort(a, lo, hi, start=None):
+    # Early-exit insertion sort of a[lo:hi]; a[lo:start] is already sorted
+    if start is None:
+        start = lo + 1
+    for i in range(max(start, lo + 1), hi):
+        item = a[i]
+        j = i - 1
+        while j >= lo and a[j] < item:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = item
+
+
+def _merge_runs(a, runEnds):
+    # Bottom-up merging of adjacent runs until a single run is left
+    bounds = [0] + runEnds
+    while len(bounds) > 2:
+        merged = [0]
+        for k in range(0, len(bounds) - 2, 2):
+            lo, mid, hi = bounds[k], bounds[k + 1], bounds[k + 2]
+            _merge(a, lo, mid, hi)
+            merged.append(hi)
+        if len(bounds) % 2 == 0:
+            merged.append(bounds[-1])
+        bounds = merged
+
+
+def _merge(a, lo, mid, hi):
+    # Already in order, nothing to do
+    if not a[mid - 1] < a[mid]:
+        return
+    left = a[lo:mid]
+    right = a[mid:hi]
+    i = j = 0
+    k = lo
+    nLeft, nRight = len(left), len(right)
+    while i < nLeft and j < nRight:
+        # Take from the left on ties so the merge is stable
+        if left[i] < right[j]:
+            a[k] = right[j]
+            j += 1
+        else:
+            a[k] = left[i]
+            i += 1
+        k += 1
+    if i < nLeft:
+        a[k:hi] = left[i:]
+    elif j < nRight:
+        a[k:hi] = right[j:]
+
+
+def _introsort(a, lo, hi, depth):
+    while hi - lo > SMALL_SORT:
+        if depth == 0:
+            _heapsort(a, lo, hi)
+            return
+        depth -= 1
+
+        # Median of three as the pivot
+        mid = (lo + hi) // 2
+        x, y, z = a[lo], a[mid], a[hi - 1]
+        if x < y:
+            x, y = y, x
+        if y < z:
+            y, z = z, y
+            if x < y:
+                x, y = y, x
+        pivot = y
+
+        # Three-way partition: [> pivot | == pivot | < pivot]
+        lt, i, gt = lo, lo, hi - 1
+        while i <= gt:
+            item = a[i]
+            if pivot < item:
+                a[lt], a[i] = item, a[lt]
+                lt += 1
+                i += 1
+            elif item < pivot:
+                a[gt], a[i] = item, a[gt]
+                gt -= 1
+            else:
+                i += 1
+
+        # Recurse into the smaller side, loop on the larger one
+        if lt - lo < hi - gt - 1:
+            _introsort(a, lo, lt, depth)
+            lo = gt + 1
+        else:
+            _introsort(a, gt + 1, hi, depth)
+            hi = lt
+    _insertion_sort(a, lo, hi)
+
+
+def _heapsort(a, lo, hi):
+    # Min-heap on a[lo:hi]; repeatedly moving the minimum to the end leaves
+    # the range in descending order
+    n = hi - lo
+    for start in range(n // 2 - 1, -1, -1):
+        _sift_down(a, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        a[lo], a[lo + end] = a[lo + end], a[lo]
+        _sift_down(a, lo, 0, end)
+
+
+def _sift_down(a, lo, root, size):
+    item = a[lo + root]
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            break
+        if child + 1 < size and a[lo + child + 1] < a[lo + child]:
+            child += 1
+        if not a[lo + child] < item:
+            break
+        a[lo + root] = a[lo + child]
+        root = child
+    a[lo + root] = item
+
+
+# Example usage:
+if __name__ == "__main__":
+    myList = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Strategy: {choose_strategy(myList)}")
+    print(f"Sorted list (descending): {sort_descending(myList)}")
+
+    words = ["pear", "fig", "banana", "kiwi", "apple"]
+    print(f"Sorted by length (descending): {sort_descending(words, key=len)}")
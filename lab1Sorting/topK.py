@@ -0,0 +1,103 @@
+import heapq
+import itertools
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def top_k_descending(iterable, k, key=None):
+    """
+    Returns the k largest elements of an iterable in descending order.
+
+    The input is consumed in a single pass while a min-heap holds the best k
+    elements seen so far, so it takes O(n log k) time and O(k) memory and
+    works on generators that can't be held in memory. Equal elements keep
+    their input order, as with a stable descending sort.
+
+    Args:
+        iterable: The elements to select from.
+        k (int): How many elements to return.
+        key: Optional function of one argument used to extract the value
+             each element is compared by.
+
+    Returns:
+        list: Up to k elements, largest first.
+    """
+    if k <= 0:
+        return []
+
+    # Heap entries are (value, -index, element): the index makes every entry
+    # unique (elements themselves are never compared) and, among equal values,
+    # puts the latest element at the root so it is the first one evicted
+    heap = []
+    counter = itertools.count()
+    iterator = iter(iterable)
+    for element in itertools.islice(iterator, k):
+        value = element if key is None else key(element)
+        heap.append((value, -next(counter), element))
+    heapq.heapify(heap)
+
+    for element in iterator:
+        value = element if key is None else key(element)
+        index = next(counter)
+        # Only beat the current k-th best on a strictly larger value
+        if heap[0][0] < value:
+            heapq.heapreplace(heap, (value, -index, element))
+
+    heap.sort(reverse=True)
+    return [element for _, _, element in heap]
+
+
+def top_k_descending_numpy(values, k, return_indices=False):
+    """
+    Vectorized top-k for NumPy arrays using partition/select.
+
+    np.argpartition finds the k largest values in linear time and only
+    those k are then sorted. Among equal values at the k-th position, which
+    ones are kept is up to NumPy.
+
+    Args:
+        values: A one-dimensional NumPy array (or anything np.asarray accepts).
+        k (int): How many elements to return.
+        return_indices (bool): Also return the positions of the elements.
+
+    Returns:
+        The k largest values in descending order as an array, or a
+        (values, indices) tuple if return_indices is True.
+    """
+    if np is None:
+        raise ImportError("top_k_descending_numpy requires NumPy")
+    values = np.asarray(values)
+    n = values.shape[0]
+    k = max(0, min(k, n))
+    if k == 0:
+        indices = np.empty(0, dtype=np.intp)
+    elif k == n:
+        indices = np.arange(n)
+    else:
+        indices = np.argpartition(values, n - k)[n - k:]
+    # Sort the selected k ascending by (value, -position) and reverse it, so
+    # values come out descending and equal values in position order
+    indices = indices[np.lexsort((-indices, values[indices]))[::-1]]
+    if return_indices:
+        return values[indices], indices
+    return values[indices]
+
+
+# Example usage:
+if __name__ == "__main__":
+    import random
+
+    myList = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Top 3 (descending): {top_k_descending(myList, 3)}")
+
+    stream = (random.randint(0, 1000000) for _ in range(1000000))
+    print(f"Top 5 of a million-value stream: {top_k_descending(stream, 5)}")
+
+    words = ["pear", "fig", "banana", "kiwi", "apple"]
+    print(f"Two longest words: {top_k_descending(words, 2, key=len)}")
+
+    if np is not None:
+        print(f"Top 3 with NumPy: {top_k_descending_numpy(np.array(myList), 3)}")
@@ -0,0 +1,113 @@
+import array
+import mmap
+import os
+from multiprocessing import Pool, Value
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ITEM_SIZE = 8               # bytes per int64 value
+TASK_SIZE = 1 << 22         # values per task handed to a worker (32 MB)
+CHUNK_SIZE = 1 << 18        # values compared per vectorized step inside a task
+
+_best = None
+
+
+def mmap_linear_search(path, target, workers=None, task_size=TASK_SIZE):
+    """
+    Performs a linear search over a binary file of native-endian int64
+    values without loading it into memory.
+
+    The file is memory-mapped and split into ranges that a pool of worker
+    processes scans with a vectorized comparison. Ranges are handed out in
+    file order and the lowest match found so far is shared between the
+    workers, so a worker skips (or stops scanning) any range that starts
+    past it.
+
+    Args:
+        path: The file to be searched.
+        target (int): The value to search for.
+        workers (int): Number of worker processes (all CPUs if None).
+        task_size (int): Number of values in each range handed to a worker.
+
+    Returns:
+        The index (value offset, not byte offset) of the first occurrence of
+        target, otherwise returns -1.
+    """
+    n = os.path.getsize(path) // ITEM_SIZE
+    if n == 0:
+        return -1
+    if workers is None:
+        workers = os.cpu_count() or 1
+    ranges = [(start, min(start + task_size, n)) for start in range(0, n, task_size)]
+
+    best = Value("q", n)
+    if workers == 1 or len(ranges) == 1:
+        _init_worker(best)
+        for lo, hi in ranges:
+            if _scan_range(path, target, lo, hi) != -1:
+                break
+    else:
+        with Pool(min(workers, len(ranges)), initializer=_init_worker, initargs=(best,)) as pool:
+            for _ in pool.imap_unordered(_scan_task, [(path, target, lo, hi) for lo, hi in ranges]):
+                pass
+    return best.value if best.value < n else -1
+
+
+def _init_worker(best):
+    global _best
+    _best = best
+
+
+def _scan_task(task):
+    return _scan_range(*task)
+
+
+def _scan_range(path, target, lo, hi):
+    # Scans values [lo, hi) and records a hit in the shared best index
+    if lo >= _best.value:
+        return -1
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for start in range(lo, hi, CHUNK_SIZE):
+            # A lower match elsewhere makes the rest of this range pointless
+            if start >= _best.value:
+                return -1
+            end = min(start + CHUNK_SIZE, hi)
+            hit = _find_in_chunk(mm, target, start, end)
+            if hit != -1:
+                with _best.get_lock():
+                    if hit < _best.value:
+                        _best.value = hit
+                return hit
+    return -1
+
+
+def _find_in_chunk(mm, target, start, end):
+    if np is not None:
+        values = np.frombuffer(mm, dtype=np.int64, count=end - start, offset=start * ITEM_SIZE)
+        hits = np.flatnonzero(values == target)
+        result = start + int(hits[0]) if hits.size else -1
+        del values  # release the buffer before the mmap is closed
+        return result
+    values = array.array("q", mm[start * ITEM_SIZE:end * ITEM_SIZE])
+    try:
+        return start + values.index(target)
+    except ValueError:
+        return -1
+
+
+# Example usage:
+if __name__ == "__main__":
+    import random
+    import tempfile
+
+    values = array.array("q", (random.randint(0, 1000) for _ in range(1000000)))
+    values[750000] = -5
+    with tempfile.TemporaryDirectory() as workDir:
+        path = os.path.join(workDir, "values.bin")
+        with open(path, "wb") as f:
+            values.tofile(f)
+        print(f"Index of -5: {mmap_linear_search(path, -5, workers=4, task_size=100000)}")
+        print(f"Index of -6: {mmap_linear_search(path, -6, workers=4, task_size=100000)}")
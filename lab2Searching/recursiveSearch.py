@@ -1,23 +1,79 @@
+import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CHUNK_SIZE = 1 << 16  # elements compared per vectorized step
+
+
 def linear_search_recursive(arr, target, index=0):
-    print(f"{index}, {target}, {arr[index]}")
     if index == len(arr):
-        return -1 
+        return -1
+    print(f"{index}, {target}, {arr[index]}")
     if arr[index] == target:
         return index
-    
+
     # Recursive call to check the next element
     return linear_search_recursive(arr, target, index + 1)
 
+def linear_search_chunked(arr, target, index=0, chunk_size=CHUNK_SIZE):
+    """
+    Iterative drop-in for linear_search_recursive with no recursion depth
+    limit and no per-step printing.
+
+    NumPy arrays (and numeric array.array buffers) are scanned one chunk at
+    a time with a vectorized equality test, stopping at the first chunk
+    that has a hit. Lists and tuples use their built-in index(), which is
+    already a C loop that stops at the first match.
+
+    Args:
+        arr: The sequence to be searched.
+        target: The value to search for.
+        index (int): Position to start searching from.
+        chunk_size (int): Number of elements compared per vectorized step.
+
+    Returns:
+        The index of the target value if found, otherwise returns -1.
+    """
+    n = len(arr)
+    if np is not None and isinstance(arr, array.array) and arr.typecode != "u":
+        arr = np.frombuffer(arr, dtype=np.dtype(arr.typecode))
+    if np is not None and isinstance(arr, np.ndarray) and arr.ndim == 1:
+        for start in range(index, n, chunk_size):
+            matches = arr[start:start + chunk_size] == target
+            # Comparing with an incompatible type gives a plain bool
+            if not isinstance(matches, np.ndarray):
+                break
+            hits = np.flatnonzero(matches)
+            if hits.size:
+                return start + int(hits[0])
+        else:
+            return -1
+
+    if isinstance(arr, (list, tuple)):
+        try:
+            return arr.index(target, index)
+        except ValueError:
+            return -1
+
+    for i in range(index, n):
+        if arr[i] == target:
+            return i
+    return -1
+
 # Example
-arr = [10, 20, 30, 40, 50]
-target = 30
+if __name__ == "__main__":
+    arr = [10, 20, 30, 40, 50]
+    target = 30
 
-result = linear_search_recursive(arr, target)
+    result = linear_search_recursive(arr, target)
 
-"""if result != -1:
-    print(f"Element {target} found at index {result}.")
-else:
-    print(f"Element {target} not found in the list.")"""
-print ({result})
+    """if result != -1:
+        print(f"Element {target} found at index {result}.")
+    else:
+        print(f"Element {target} not found in the list.")"""
+    print ({result})
 
-    
\ No newline at end of file
+    print(f"Chunked search: {linear_search_chunked(arr, target)}")
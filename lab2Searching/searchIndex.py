@@ -0,0 +1,117 @@
+from linearSearch import linearSearch
+
+
+class SearchIndex:
+    """
+    A hash index over a list for answering many linearSearch-style lookups.
+
+    The index maps each value to the index of its first occurrence, so a
+    lookup is O(1) instead of a full scan, and a miss still returns -1.
+    Values appended to the list (through append() or directly on the list)
+    are picked up incrementally on the next lookup. Other changes to the
+    list (assigning, inserting or removing items) can't be detected; call
+    rebuild() after making them. A list that got shorter is rebuilt
+    automatically. Unhashable items can't go in the index; they are kept
+    aside and compared with == on every lookup, so results always match
+    linearSearch.
+    """
+
+    def __init__(self, myList):
+        self._list = myList
+        self._positions = {}
+        self._unhashable = []   # indexes of items the dict can't hold
+        self._indexedLength = 0
+        self._update()
+
+    def search(self, target):
+        """
+        Finds the first index of target in the list.
+
+        Args:
+            target: The value to search for.
+
+        Returns:
+            The index of the target value if found, otherwise returns -1.
+        """
+        self._update()
+        return self._lookup(target)
+
+    def search_many(self, targets):
+        """
+        Finds the first index of each target in the list.
+
+        Args:
+            targets: An iterable of values to search for.
+
+        Returns:
+            list: The index for each target, or -1 where it is missing.
+        """
+        self._update()
+        return [self._lookup(target) for target in targets]
+
+    def append(self, value):
+        """
+        Appends a value to the underlying list and indexes it.
+
+        Args:
+            value: The value to append.
+        """
+        self._list.append(value)
+        self._update()
+
+    def rebuild(self):
+        """
+        Re-indexes the whole list, e.g. after items were changed in place.
+        """
+        self._positions = {}
+        self._unhashable = []
+        self._indexedLength = 0
+        self._update()
+
+    def __len__(self):
+        return len(self._list)
+
+    def __contains__(self, target):
+        return self.search(target) != -1
+
+    def _update(self):
+        length = len(self._list)
+        if length < self._indexedLength:
+            self.rebuild()
+            return
+        positions = self._positions
+        for i in range(self._indexedLength, length):
+            try:
+                # setdefault keeps the first index of repeated values
+                positions.setdefault(self._list[i], i)
+            except TypeError:
+                # Unhashable items (e.g. nested lists or sets) may still
+                # equal a hashable target ({1} == frozenset({1})), so
+                # _lookup checks them separately
+                self._unhashable.append(i)
+        self._indexedLength = length
+
+    def _lookup(self, target):
+        try:
+            found = self._positions.get(target, -1)
+        except TypeError:
+            # Unhashable targets can still be compared with ==
+            return linearSearch(self._list, target)
+        # An unhashable item before the dict's answer could match first
+        for i in self._unhashable:
+            if found != -1 and i > found:
+                break
+            if self._list[i] == target:
+                return i
+        return found
+
+
+# Example usage:
+if __name__ == "__main__":
+    myList = [4, 7, 1, 9, 3, 6, 8, 7]
+    index = SearchIndex(myList)
+    print(f"Index of 9: {index.search(9)}")
+    print(f"Batch lookup of [7, 2, 8]: {index.search_many([7, 2, 8])}")
+
+    myList.append(2)
+    print(f"Index of 2 after appending it: {index.search(2)}")
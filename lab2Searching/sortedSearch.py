@@ -0,0 +1,172 @@
+from bisect import bisect_left
+from numbers import Real
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SAMPLE_SIZE = 32         # positions sampled by choose_search_method
+UNIFORM_TOLERANCE = 0.1  # max sample deviation from a straight line, as a share of the range
+
+
+def binary_search(arr, target):
+    """
+    Finds the leftmost index of target in a list sorted in ascending order.
+
+    Args:
+        arr: The sorted list to be searched.
+        target: The value to search for.
+
+    Returns:
+        The index of the first occurrence of target, otherwise returns -1.
+    """
+    return _found(arr, target, bisect_left(arr, target))
+
+
+def exponential_search(arr, target):
+    """
+    Galloping search: doubles a bound from the front of the list until it
+    passes target, then binary searches the last gap. Costs O(log i) for a
+    match at index i, so it suits targets near the start of long lists.
+
+    Args:
+        arr: The sorted list to be searched.
+        target: The value to search for.
+
+    Returns:
+        The index of the first occurrence of target, otherwise returns -1.
+    """
+    n = len(arr)
+    if n == 0:
+        return -1
+    bound = 1
+    while bound < n and arr[bound - 1] < target:
+        bound *= 2
+    return _found(arr, target, bisect_left(arr, target, bound // 2, min(bound, n)))
+
+
+def interpolation_search(arr, target):
+    """
+    Interpolation search for sorted numeric lists: guesses the position of
+    target from its value relative to the ends of the current window. Takes
+    O(log log n) probes on evenly spread keys; the probes are capped, after
+    which the remaining window is binary searched, so skewed data can't
+    degrade it past O(log n).
+
+    Args:
+        arr: The sorted list of numbers to be searched.
+        target: The value to search for.
+
+    Returns:
+        The index of the first occurrence of target, otherwise returns -1.
+    """
+    # Invariant: arr[:lo] < target <= arr[hi:]
+    lo, hi = 0, len(arr)
+    probes = max(1, len(arr).bit_length())
+    while hi - lo > 1 and probes > 0:
+        probes -= 1
+        first, last = arr[lo], arr[hi - 1]
+        if target <= first:
+            hi = lo
+            break
+        if last < target:
+            lo = hi
+            break
+        pos = lo + int((target - first) * (hi - 1 - lo) // (last - first))
+        pos = min(max(pos, lo), hi - 1)
+        if arr[pos] < target:
+            lo = pos + 1
+        else:
+            hi = pos
+    return _found(arr, target, bisect_left(arr, target, lo, hi))
+
+
+def choose_search_method(arr, samples=SAMPLE_SIZE):
+    """
+    Samples the keys of a sorted list to pick a search function for it.
+
+    Interpolation search is picked when the keys are numbers spread close
+    to evenly between the first and last key; binary search otherwise.
+
+    Args:
+        arr: The sorted list that will be searched.
+        samples (int): How many evenly spaced positions to inspect.
+
+    Returns:
+        One of interpolation_search or binary_search.
+    """
+    n = len(arr)
+    if n < 2 or not all(isinstance(arr[i], Real) for i in (0, n - 1)):
+        return binary_search
+    first, last = arr[0], arr[n - 1]
+    span = last - first
+    if span <= 0:
+        return binary_search
+    worst = 0
+    for s in range(samples + 1):
+        i = (n - 1) * s // samples
+        if not isinstance(arr[i], Real):
+            return binary_search
+        expected = first + span * i / (n - 1)
+        worst = max(worst, abs(arr[i] - expected))
+    return interpolation_search if worst <= UNIFORM_TOLERANCE * span else binary_search
+
+
+def auto_search(arr, target, method=None):
+    """
+    Searches a sorted list with the method choose_search_method picks.
+
+    For repeated searches of the same list, call choose_search_method once
+    and pass the result as method so the list is only sampled once.
+
+    Args:
+        arr: The sorted list to be searched.
+        target: The value to search for.
+        method: A search function to use instead of sampling the list.
+
+    Returns:
+        The index of the first occurrence of target, otherwise returns -1.
+    """
+    if method is None:
+        method = choose_search_method(arr)
+    return method(arr, target)
+
+
+def searchsorted_many(arr, targets):
+    """
+    Vectorized batch search of a sorted NumPy array.
+
+    Args:
+        arr: A one-dimensional NumPy array sorted in ascending order.
+        targets: The values to search for (array-like).
+
+    Returns:
+        A NumPy array with the leftmost index of each target, or -1.
+    """
+    if np is None:
+        raise ImportError("searchsorted_many requires NumPy")
+    arr = np.asarray(arr)
+    targets = np.asarray(targets)
+    positions = np.searchsorted(arr, targets, side="left")
+    if arr.shape[0] == 0:
+        return np.full(positions.shape, -1, dtype=np.intp)
+    clipped = np.minimum(positions, arr.shape[0] - 1)
+    found = (positions < arr.shape[0]) & (arr[clipped] == targets)
+    return np.where(found, positions, -1)
+
+
+def _found(arr, target, i):
+    if i < len(arr) and arr[i] == target:
+        return i
+    return -1
+
+
+# Example usage:
+if __name__ == "__main__":
+    mySortedList = [1, 3, 4, 6, 7, 7, 8, 9, 12, 15]
+    for search in (binary_search, exponential_search, interpolation_search, auto_search):
+        print(f"{search.__name__}: 7 at {search(mySortedList, 7)}, 5 at {search(mySortedList, 5)}")
+    print(f"Auto mode picks: {choose_search_method(mySortedList).__name__}")
+    if np is not None:
+        print(f"Batch search: {searchsorted_many(np.array(mySortedList), [7, 5, 15])}")
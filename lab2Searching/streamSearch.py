@@ -0,0 +1,99 @@
+import asyncio
+import itertools
+import time
+
+
+def stream_search(iterable, target, timeout=None, budget=None):
+    """
+    Performs a linear search over any iterable, such as a generator, without
+    storing the values it has already seen.
+
+    Stops at the first match. The timeout is checked between items, so it
+    can't interrupt an iterator that blocks while producing a single item.
+
+    Args:
+        iterable: The values to be searched.
+        target: The value to search for.
+        timeout (float): Seconds after which to give up.
+        budget (int): Maximum number of items to examine.
+
+    Returns:
+        The position of the target value if found, otherwise returns -1
+        (including when the timeout or budget ran out first).
+    """
+    values = iter(iterable)
+    if budget is not None:
+        values = itertools.islice(values, budget)
+
+    if timeout is None:
+        for position, value in enumerate(values):
+            if value == target:
+                return position
+        return -1
+
+    deadline = time.monotonic() + timeout
+    for position, value in enumerate(values):
+        if value == target:
+            return position
+        if time.monotonic() >= deadline:
+            break
+    return -1
+
+
+async def async_stream_search(aiterable, target, timeout=None, budget=None):
+    """
+    asyncio version of stream_search for async iterables such as values
+    read from a socket.
+
+    Stops at the first match and closes the async generator it was reading
+    from. The timeout covers the whole search, including time spent
+    waiting for the next item.
+
+    Args:
+        aiterable: The async iterable to be searched.
+        target: The value to search for.
+        timeout (float): Seconds after which to give up.
+        budget (int): Maximum number of items to examine.
+
+    Returns:
+        The position of the target value if found, otherwise returns -1
+        (including when the timeout or budget ran out first).
+    """
+    iterator = aiterable.__aiter__()
+    try:
+        return await asyncio.wait_for(_scan(iterator, target, budget), timeout)
+    except asyncio.TimeoutError:
+        return -1
+    finally:
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()
+
+
+async def _scan(iterator, target, budget):
+    position = 0
+    while budget is None or position < budget:
+        try:
+            value = await iterator.__anext__()
+        except StopAsyncIteration:
+            break
+        if value == target:
+            return position
+        position += 1
+    return -1
+
+
+# Example usage:
+if __name__ == "__main__":
+    import random
+
+    feed = (random.randint(0, 100) for _ in range(1000000))
+    print(f"First 42 in the feed at position: {stream_search(feed, 42)}")
+    print(f"-1 within a 1000 item budget: {stream_search(iter(int, 1), -1, budget=1000)}")
+
+    async def live_feed():
+        for value in [4, 7, 1, 9, 3, 6, 8]:
+            await asyncio.sleep(0.01)
+            yield value
+
+    print(f"Async search for 9: {asyncio.run(async_stream_search(live_feed(), 9))}")
+    print(f"Async search for 8 with a 0.03s timeout: {asyncio.run(async_stream_search(live_feed(), 8, timeout=0.03))}")
@@ -0,0 +1,169 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class BitsetGraph:
+    """
+    An adjacency matrix for dense graphs where each row is one Python int:
+    bit j of rows[i] is set when there is an edge from i to j.
+
+    A row takes V bits instead of V list slots, and the unvisited neighbors
+    of a node are found with a single mask (row & ~visited) that works on
+    whole machine words at a time instead of checking V cells one by one.
+    """
+
+    def __init__(self, num_nodes, rows=None):
+        self.num_nodes = num_nodes
+        self.rows = rows if rows is not None else [0] * num_nodes
+
+    @classmethod
+    def from_matrix(cls, adj_matrix):
+        """
+        Builds a bitset graph from a list-of-lists adjacency matrix.
+
+        Args:
+            adj_matrix (list): A V x V list of lists where 1 marks an edge.
+
+        Returns:
+            BitsetGraph: The new graph.
+        """
+        rows = []
+        for row in adj_matrix:
+            # Reversed so that column j ends up as bit j
+            bits = "".join("1" if cell == 1 else "0" for cell in reversed(row))
+            rows.append(int(bits, 2) if bits else 0)
+        return cls(len(adj_matrix), rows)
+
+    @classmethod
+    def from_adj_list(cls, adj_list):
+        """
+        Builds a bitset graph from an adjacency list (or a CSRGraph's
+        to_adj_list()).
+
+        Args:
+            adj_list (list): adj_list[u] is the list of neighbors of u.
+
+        Returns:
+            BitsetGraph: The new graph.
+        """
+        rows = []
+        for neighbors in adj_list:
+            row = 0
+            for v in neighbors:
+                row |= 1 << v
+            rows.append(row)
+        return cls(len(adj_list), rows)
+
+    def add_edge(self, i, j):
+        """Adds an undirected edge, like add_edge does for the matrix."""
+        self.rows[i] |= 1 << j
+        self.rows[j] |= 1 << i
+
+    def has_edge(self, i, j):
+        return (self.rows[i] >> j) & 1 == 1
+
+    def degree(self, u):
+        return self.rows[u].bit_count()
+
+    def neighbors(self, u):
+        """
+        Yields the neighbors of u in ascending order.
+
+        Args:
+            u (int): The node.
+
+        Yields:
+            int: Each neighbor id, smallest first.
+        """
+        yield from iter_set_bits(self.rows[u])
+
+    def to_matrix(self):
+        """Converts the graph back to a V x V list of lists of 0s and 1s."""
+        V = self.num_nodes
+        return [[(row >> j) & 1 for j in range(V)] for row in self.rows]
+
+    def to_packed(self):
+        """
+        Packs the rows into a V x ceil(V / 64) NumPy uint64 array, with
+        column j stored in bit j % 64 of word j // 64.
+
+        Returns:
+            numpy.ndarray: The packed rows.
+        """
+        if np is None:
+            raise ImportError("to_packed requires NumPy")
+        words = (self.num_nodes + 63) // 64
+        packed = np.zeros((self.num_nodes, words), dtype=np.uint64)
+        for u, row in enumerate(self.rows):
+            packed[u] = np.frombuffer(row.to_bytes(8 * words, "little"), dtype="<u8")
+        return packed
+
+    @classmethod
+    def from_packed(cls, packed):
+        """
+        Builds a bitset graph from the array to_packed returns.
+
+        Args:
+            packed (numpy.ndarray): A V x ceil(V / 64) uint64 array.
+
+        Returns:
+            BitsetGraph: The new graph.
+        """
+        rows = [int.from_bytes(row.astype("<u8").tobytes(), "little") for row in packed]
+        return cls(len(rows), rows)
+
+    def dfs_traversal(self, start_node):
+        """
+        Depth first traversal in the same order as dfs_traversal_matrix in
+        lab3Graphs (smallest neighbor first, nodes marked visited when
+        pushed).
+
+        All unvisited neighbors of the popped node are found and marked with
+        one mask operation; they are then pushed largest first so that the
+        smallest is popped next.
+
+        Args:
+            start_node (int): The node to start from.
+
+        Returns:
+            list: The nodes in the order they were visited.
+        """
+        rows = self.rows
+        visited = 1 << start_node
+        stack = [start_node]
+        traversal_path = []
+        while stack:
+            current_node = stack.pop()
+            traversal_path.append(current_node)
+            new = rows[current_node] & ~visited
+            if new:
+                visited |= new
+                found = list(iter_set_bits(new))
+                found.reverse()
+                stack.extend(found)
+        return traversal_path
+
+    def __repr__(self):
+        return f"BitsetGraph({self.num_nodes} nodes)"
+
+
+def iter_set_bits(bits):
+    # Lowest-set-bit iteration: bits & -bits isolates the lowest 1
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+# Main part of the script
+if __name__ == "__main__":
+    # Same graph as the lab3Graphs demo: node 4 is disconnected
+    graph = BitsetGraph(5)
+    graph.add_edge(0, 1)
+    graph.add_edge(0, 2)
+    graph.add_edge(1, 3)
+    graph.add_edge(2, 3)
+    print(f"Rows as bits: {[bin(row) for row in graph.rows]}")
+    print(f"Depth First Traversal from 0: {graph.dfs_traversal(0)}")
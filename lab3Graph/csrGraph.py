@@ -0,0 +1,266 @@
+from array import array
+
+INDEX_TYPE = "q"   # int64 offsets and node ids
+WEIGHT_TYPE = "d"  # float64 edge weights
+
+
+class CSRGraph:
+    """
+    A graph stored in compressed sparse row (CSR) form.
+
+    The neighbors of node u are targets[offsets[u]:offsets[u + 1]], kept in
+    ascending order with duplicates removed, so a graph with V nodes and E
+    edges takes O(V + E) memory instead of the V x V cells of an adjacency
+    matrix. offsets and targets are flat int64 buffers: array.array when
+    built here, or NumPy arrays (possibly memory-mapped) when loaded with
+    graphIO; NumPy can wrap either without copying (np.frombuffer).
+
+    Weighted graphs also have weights, a float64 buffer parallel to targets;
+    unweighted graphs have weights set to None.
+
+    Undirected graphs store every edge in both directions, like add_edge
+    does for the adjacency matrix.
+    """
+
+    def __init__(self, num_nodes, offsets, targets, directed=False, weights=None):
+        self.num_nodes = num_nodes
+        self.offsets = offsets
+        self.targets = targets
+        self.directed = directed
+        self.weights = weights
+
+    @classmethod
+    def from_edges(cls, num_nodes, edges, directed=False, weighted=False):
+        """
+        Builds a graph from an edge list in O(V + E) time.
+
+        Args:
+            num_nodes (int): Number of nodes; ids run from 0 to num_nodes - 1.
+            edges: An iterable of (u, v) pairs, or (u, v, weight) triples if
+                   weighted is True.
+            directed (bool): If False, every edge is added in both directions.
+            weighted (bool): Whether the edges carry weights. If an edge is
+                             given more than once, the smallest weight is kept.
+
+        Returns:
+            CSRGraph: The new graph.
+        """
+        sources = array(INDEX_TYPE)
+        dests = array(INDEX_TYPE)
+        weights = array(WEIGHT_TYPE) if weighted else None
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            sources.append(u)
+            dests.append(v)
+            if weighted:
+                weights.append(edge[2])
+            if not directed and u != v:
+                sources.append(v)
+                dests.append(u)
+                if weighted:
+                    weights.append(edge[2])
+        return cls._from_arcs(num_nodes, sources, dests, directed, weights)
+
+    @classmethod
+    def from_matrix(cls, adj_matrix):
+        """
+        Builds a graph from an adjacency matrix such as the ones filled in by
+        add_edge, in a single pass over its cells.
+
+        Args:
+            adj_matrix (list): A V x V list of lists where 1 marks an edge.
+
+        Returns:
+            CSRGraph: The new graph.
+        """
+        V = len(adj_matrix)
+        offsets = array(INDEX_TYPE, [0])
+        targets = array(INDEX_TYPE)
+        symmetric = True
+        for i in range(V):
+            row = adj_matrix[i]
+            for j in range(V):
+                if row[j] == 1:
+                    targets.append(j)
+                    if symmetric and adj_matrix[j][i] != 1:
+                        symmetric = False
+            offsets.append(len(targets))
+        return cls(V, offsets, targets, directed=not symmetric)
+
+    @classmethod
+    def from_adj_list(cls, adj_list, directed=False):
+        """
+        Builds a graph from an adjacency list such as create_adj_list returns.
+
+        Args:
+            adj_list (list): adj_list[u] is the list of neighbors of u.
+            directed (bool): Whether the lists describe a directed graph.
+                             Undirected lists must already contain both
+                             directions of every edge.
+
+        Returns:
+            CSRGraph: The new graph.
+        """
+        offsets = array(INDEX_TYPE, [0])
+        targets = array(INDEX_TYPE)
+        for neighbors in adj_list:
+            targets.extend(sorted(set(neighbors)))
+            offsets.append(len(targets))
+        return cls(len(adj_list), offsets, targets, directed)
+
+    @classmethod
+    def _from_arcs(cls, num_nodes, sources, dests, directed, weights=None):
+        # Counting sort by destination, then a stable counting sort by source,
+        # leaves every row sorted without comparing any two node ids
+        byDest = _counting_order(dests, num_nodes)
+        counts = array(INDEX_TYPE, bytes(8 * (num_nodes + 1)))
+        for u in sources:
+            counts[u + 1] += 1
+        for u in range(num_nodes):
+            counts[u + 1] += counts[u]
+        offsets = array(INDEX_TYPE, counts)
+        targets = array(INDEX_TYPE, bytes(8 * len(dests)))
+        rowWeights = array(WEIGHT_TYPE, bytes(8 * len(dests))) if weights is not None else None
+        for arc in byDest:
+            u = sources[arc]
+            targets[counts[u]] = dests[arc]
+            if weights is not None:
+                rowWeights[counts[u]] = weights[arc]
+            counts[u] += 1
+
+        # Drop repeated edges; rows are sorted so repeats are adjacent
+        write = 0
+        start = 0
+        for u in range(num_nodes):
+            end = offsets[u + 1]
+            offsets[u] = write
+            previous = -1
+            for k in range(start, end):
+                v = targets[k]
+                if v != previous:
+                    targets[write] = v
+                    if weights is not None:
+                        rowWeights[write] = rowWeights[k]
+                    write += 1
+                    previous = v
+                elif weights is not None and rowWeights[k] < rowWeights[write - 1]:
+                    rowWeights[write - 1] = rowWeights[k]
+            start = end
+        offsets[num_nodes] = write
+        del targets[write:]
+        if weights is not None:
+            del rowWeights[write:]
+        return cls(num_nodes, offsets, targets, directed, rowWeights)
+
+    @property
+    def num_edges(self):
+        """Number of stored arcs (each undirected edge counts twice)."""
+        return len(self.targets)
+
+    def neighbors(self, u):
+        """
+        Returns the sorted neighbors of u as a zero-copy memoryview slice.
+
+        Args:
+            u (int): The node.
+
+        Returns:
+            memoryview: The neighbor ids of u.
+        """
+        return memoryview(self.targets)[self.offsets[u]:self.offsets[u + 1]]
+
+    def degree(self, u):
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def to_adj_list(self):
+        """Converts the graph to the list-of-lists form used by lab3Graphs."""
+        targets = self.targets
+        offsets = self.offsets
+        return [targets[offsets[u]:offsets[u + 1]].tolist() for u in range(self.num_nodes)]
+
+    def to_dict_graph(self):
+        """
+        Converts the graph to the dict-of-dicts form used by
+        lab4ShortestPath, {u: {v: weight}}. Unweighted edges get weight 1.
+        """
+        offsets = self.offsets
+        targets = self.targets
+        weights = self.weights
+        graph = {}
+        for u in range(self.num_nodes):
+            start, end = int(offsets[u]), int(offsets[u + 1])
+            if weights is None:
+                graph[u] = dict.fromkeys(targets[start:end].tolist(), 1)
+            else:
+                graph[u] = dict(zip(targets[start:end].tolist(), weights[start:end].tolist()))
+        return graph
+
+    def to_matrix(self):
+        """Converts the graph to a V x V adjacency matrix of 0s and 1s."""
+        matrix = [[0] * self.num_nodes for _ in range(self.num_nodes)]
+        for u in range(self.num_nodes):
+            row = matrix[u]
+            for k in range(self.offsets[u], self.offsets[u + 1]):
+                row[self.targets[k]] = 1
+        return matrix
+
+    def dfs_traversal(self, start_node):
+        """
+        Depth first traversal that visits nodes in the same order as
+        dfs_traversal and dfs_traversal_matrix in lab3Graphs (smallest
+        neighbor first, nodes marked visited when pushed).
+
+        Rows are already sorted, so each popped node costs O(degree) rather
+        than a sort (list version) or a scan of V columns (matrix version).
+
+        Args:
+            start_node (int): The node to start from.
+
+        Returns:
+            list: The nodes in the order they were visited.
+        """
+        offsets = self.offsets
+        targets = self.targets
+        visited = bytearray(self.num_nodes)
+        stack = [start_node]
+        visited[start_node] = 1
+        traversal_path = []
+        while stack:
+            current_node = stack.pop()
+            traversal_path.append(current_node)
+            # Push in reverse so the smallest neighbor is popped first
+            for k in range(offsets[current_node + 1] - 1, offsets[current_node] - 1, -1):
+                neighbor = targets[k]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    stack.append(neighbor)
+        return traversal_path
+
+    def __repr__(self):
+        kind = "directed" if self.directed else "undirected"
+        if self.weights is not None:
+            kind = "weighted " + kind
+        return f"CSRGraph({self.num_nodes} nodes, {self.num_edges} arcs, {kind})"
+
+
+def _counting_order(keys, num_keys):
+    # Positions of keys in ascending key order, stable, in O(len(keys) + num_keys)
+    counts = array(INDEX_TYPE, bytes(8 * (num_keys + 1)))
+    for key in keys:
+        counts[key + 1] += 1
+    for key in range(num_keys):
+        counts[key + 1] += counts[key]
+    order = array(INDEX_TYPE, bytes(8 * len(keys)))
+    for position, key in enumerate(keys):
+        order[counts[key]] = position
+        counts[key] += 1
+    return order
+
+
+# Main part of the script
+if __name__ == "__main__":
+    # Same graph as the lab3Graphs demo: node 4 is disconnected
+    graph = CSRGraph.from_edges(5, [(0, 1), (0, 2), (1, 3), (2, 3)])
+    print(graph)
+    print(f"Adjacency list: {graph.to_adj_list()}")
+    print(f"Depth First Traversal from 0: {graph.dfs_traversal(0)}")
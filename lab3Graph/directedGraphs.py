@@ -0,0 +1,174 @@
+from array import array
+from collections import deque
+
+from csrGraph import INDEX_TYPE
+from traversal import as_csr
+
+
+def strongly_connected_components(graph):
+    """
+    Labels the strongly connected components of a directed graph with an
+    iterative version of Tarjan's algorithm, in O(V + E) time and with an
+    explicit stack instead of recursion, so long paths can't hit the
+    recursion limit.
+
+    Components are numbered in the order Tarjan's algorithm completes them,
+    which is a reverse topological order of the condensed graph: every edge
+    between two different components goes from a higher label to a lower
+    one.
+
+    Args:
+        graph: A CSRGraph or an adjacency list.
+
+    Returns:
+        tuple: (number of components, array of component labels per node).
+    """
+    graph = as_csr(graph)
+    offsets = graph.offsets
+    targets = graph.targets
+    V = graph.num_nodes
+    UNSEEN = -1
+    index = array(INDEX_TYPE, [UNSEEN]) * V   # discovery order
+    low = array(INDEX_TYPE, [0]) * V          # lowest index reachable
+    labels = array(INDEX_TYPE, [UNSEEN]) * V
+    onStack = bytearray(V)
+    componentStack = []
+    count = 0
+    counter = 0
+
+    for root in range(V):
+        if index[root] != UNSEEN:
+            continue
+        # Each frame is [node, next edge position to look at]
+        callStack = [[root, offsets[root]]]
+        index[root] = low[root] = counter
+        counter += 1
+        componentStack.append(root)
+        onStack[root] = 1
+        while callStack:
+            frame = callStack[-1]
+            u, k = frame
+            end = offsets[u + 1]
+            descended = False
+            while k < end:
+                v = targets[k]
+                k += 1
+                if index[v] == UNSEEN:
+                    # "Recurse" into v and resume u at edge k afterwards
+                    frame[1] = k
+                    index[v] = low[v] = counter
+                    counter += 1
+                    componentStack.append(v)
+                    onStack[v] = 1
+                    callStack.append([v, offsets[v]])
+                    descended = True
+                    break
+                if onStack[v] and index[v] < low[u]:
+                    low[u] = index[v]
+            if descended:
+                continue
+
+            # All edges of u are done
+            callStack.pop()
+            if callStack:
+                parent = callStack[-1][0]
+                if low[u] < low[parent]:
+                    low[parent] = low[u]
+            if low[u] == index[u]:
+                while True:
+                    w = componentStack.pop()
+                    onStack[w] = 0
+                    labels[w] = count
+                    if w == u:
+                        break
+                count += 1
+    return count, labels
+
+
+def topological_sort(graph):
+    """
+    Orders the nodes of a directed graph so that every edge goes from an
+    earlier node to a later one, with Kahn's algorithm (repeatedly take a
+    node with no remaining incoming edges), in O(V + E) time.
+
+    Nodes are taken first in, first out: the nodes without incoming edges
+    in ascending id order, then every other node in the order its last
+    incoming edge is removed.
+
+    Args:
+        graph: A CSRGraph or an adjacency list.
+
+    Returns:
+        tuple: (order, None) for an acyclic graph, or (None, cycle) where
+               cycle is a list of nodes [c0, c1, ..., ck] with an edge from
+               each to the next and from ck back to c0.
+    """
+    graph = as_csr(graph)
+    offsets = graph.offsets
+    targets = graph.targets
+    V = graph.num_nodes
+    indegree = array(INDEX_TYPE, [0]) * V
+    for k in range(len(targets)):
+        indegree[targets[k]] += 1
+
+    ready = deque(u for u in range(V) if indegree[u] == 0)
+    order = []
+    while ready:
+        u = ready.popleft()
+        order.append(u)
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            indegree[v] -= 1
+            if indegree[v] == 0:
+                ready.append(v)
+
+    if len(order) == V:
+        return order, None
+    return None, _find_cycle(graph, indegree)
+
+
+def _find_cycle(graph, indegree):
+    # Every node Kahn's algorithm couldn't take still has a predecessor that
+    # it couldn't take either, so walking predecessors must come back around
+    offsets = graph.offsets
+    targets = graph.targets
+    V = graph.num_nodes
+    predecessor = array(INDEX_TYPE, [-1]) * V
+    for u in range(V):
+        if indegree[u] > 0:
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if indegree[v] > 0:
+                    predecessor[v] = u
+
+    start = next(u for u in range(V) if indegree[u] > 0)
+    seen = bytearray(V)
+    u = start
+    while not seen[u]:
+        seen[u] = 1
+        u = predecessor[u]
+    cycle = [u]
+    v = predecessor[u]
+    while v != u:
+        cycle.append(v)
+        v = predecessor[v]
+    cycle.reverse()
+    return cycle
+
+
+# Main part of the script
+if __name__ == "__main__":
+    from csrGraph import CSRGraph
+
+    # 0 -> 1 -> 2 -> 0 is a cycle; 3 -> 4 hangs off it
+    graph = CSRGraph.from_edges(5, [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4)], directed=True)
+    count, labels = strongly_connected_components(graph)
+    print(f"{count} strongly connected components: {labels.tolist()}")
+    print(f"Topological sort: {topological_sort(graph)}")
+
+    dag = CSRGraph.from_edges(5, [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4)], directed=True)
+    print(f"Topological sort of a DAG: {topological_sort(dag)}")
+
+    # A million-node path would need a million nested calls if recursive
+    path = CSRGraph.from_edges(1000000, [(u, u + 1) for u in range(999999)], directed=True)
+    print(f"Components of a 1M-node path: {strongly_connected_components(path)[0]}")
@@ -0,0 +1,251 @@
+import os
+import struct
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from csrGraph import CSRGraph, INDEX_TYPE, WEIGHT_TYPE
+
+CHUNK_BYTES = 16 * 1024 * 1024   # text read per parsing step
+MAGIC = b"CSRGRAF1"
+# magic, flags, num_nodes, num_arcs, padded to 64 bytes so the arrays that
+# follow stay 8-byte aligned for memory mapping
+HEADER = struct.Struct("<8sQQQ32x")
+FLAG_DIRECTED = 1
+FLAG_WEIGHTED = 2
+
+
+def load_edge_list(path, num_nodes=None, directed=False, weighted=False, comment="#"):
+    """
+    Streams a whitespace-separated text edge list ("u v" or "u v weight" per
+    line) into a CSRGraph.
+
+    The file is read CHUNK_BYTES at a time and each chunk is parsed straight
+    into typed NumPy arrays (np.fromstring), so no Python object is created
+    per edge. Lines starting with the comment character are skipped. The
+    graph is then assembled with vectorized sorts; if an edge appears more
+    than once, the smallest weight is kept, as in CSRGraph.from_edges.
+
+    Args:
+        path: The text file to read.
+        num_nodes (int): Number of nodes (largest id + 1 if None).
+        directed (bool): If False, every edge is added in both directions.
+        weighted (bool): Whether each line has a third, weight column.
+        comment (str): Lines starting with this are ignored.
+
+    Returns:
+        CSRGraph: The graph, backed by NumPy arrays.
+    """
+    if np is None:
+        raise ImportError("load_edge_list requires NumPy")
+    columns = 3 if weighted else 2
+    sources, dests, weights = [], [], []
+    for block in _read_edge_blocks(path, columns, comment):
+        if weighted:
+            # Ids are parsed as floats alongside the weights; they are exact up to 2**53
+            sources.append(block[:, 0].astype(np.int64))
+            dests.append(block[:, 1].astype(np.int64))
+            weights.append(block[:, 2].astype(np.float64))
+        else:
+            sources.append(block[:, 0])
+            dests.append(block[:, 1])
+    sources = np.concatenate(sources) if sources else np.empty(0, dtype=np.int64)
+    dests = np.concatenate(dests) if dests else np.empty(0, dtype=np.int64)
+    weights = np.concatenate(weights) if weighted and weights else (np.empty(0) if weighted else None)
+    if num_nodes is None:
+        num_nodes = int(max(sources.max(initial=-1), dests.max(initial=-1))) + 1
+    return build_csr(num_nodes, sources, dests, weights, directed)
+
+
+def build_csr(num_nodes, sources, dests, weights=None, directed=False):
+    """
+    Vectorized CSRGraph construction from parallel NumPy edge arrays.
+
+    Args:
+        num_nodes (int): Number of nodes.
+        sources: int64 array of edge sources.
+        dests: int64 array of edge destinations.
+        weights: float64 array of edge weights, or None.
+        directed (bool): If False, every edge is added in both directions.
+
+    Returns:
+        CSRGraph: The graph, backed by NumPy arrays.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    dests = np.asarray(dests, dtype=np.int64)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)
+    if not directed:
+        back = sources != dests
+        sources, dests = np.concatenate((sources, dests[back])), np.concatenate((dests, sources[back]))
+        if weights is not None:
+            weights = np.concatenate((weights, weights[back]))
+
+    # Sort by (source, dest, weight) and keep the first copy of each edge
+    keys = (dests, sources) if weights is None else (weights, dests, sources)
+    order = np.lexsort(keys)
+    sources, dests = sources[order], dests[order]
+    keep = np.ones(sources.size, dtype=bool)
+    keep[1:] = (sources[1:] != sources[:-1]) | (dests[1:] != dests[:-1])
+    sources, targets = sources[keep], dests[keep]
+    if weights is not None:
+        weights = weights[order][keep]
+
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+    return CSRGraph(num_nodes, offsets, targets, directed, weights)
+
+
+def save_graph(graph, path):
+    """
+    Writes a CSRGraph to a compact binary file: a 64-byte header followed by
+    the raw int64 offsets, int64 targets and (if weighted) float64 weights.
+
+    Args:
+        graph (CSRGraph): The graph to save.
+        path: The file to write.
+    """
+    flags = (FLAG_DIRECTED if graph.directed else 0) | (FLAG_WEIGHTED if graph.weights is not None else 0)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, flags, graph.num_nodes, len(graph.targets)))
+        f.write(_raw_bytes(graph.offsets, INDEX_TYPE))
+        f.write(_raw_bytes(graph.targets, INDEX_TYPE))
+        if graph.weights is not None:
+            f.write(_raw_bytes(graph.weights, WEIGHT_TYPE))
+
+
+def load_graph(path, mmap=True):
+    """
+    Loads a graph written by save_graph.
+
+    With mmap=True (and NumPy available) the arrays are read-only memory
+    maps of the file, so loading costs a header read no matter how big the
+    graph is, and processes that load the same file share its pages through
+    the OS page cache instead of each holding a copy.
+
+    Args:
+        path: The file to read.
+        mmap (bool): Memory-map the arrays instead of reading them in.
+
+    Returns:
+        CSRGraph: The loaded graph.
+    """
+    with open(path, "rb") as f:
+        magic, flags, num_nodes, num_arcs = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a saved CSR graph")
+        weighted = bool(flags & FLAG_WEIGHTED)
+        directed = bool(flags & FLAG_DIRECTED)
+
+        if np is not None and mmap:
+            offset = HEADER.size
+            offsets = np.memmap(path, dtype="<i8", mode="r", offset=offset, shape=(num_nodes + 1,))
+            offset += 8 * (num_nodes + 1)
+            targets = _memmap(path, "<i8", offset, num_arcs)
+            offset += 8 * num_arcs
+            weights = _memmap(path, "<f8", offset, num_arcs) if weighted else None
+        else:
+            offsets = _read_array(f, INDEX_TYPE, num_nodes + 1)
+            targets = _read_array(f, INDEX_TYPE, num_arcs)
+            weights = _read_array(f, WEIGHT_TYPE, num_arcs) if weighted else None
+    return CSRGraph(num_nodes, offsets, targets, directed, weights)
+
+
+def _read_edge_blocks(path, columns, comment):
+    # Yields (rows, columns) arrays parsed from whole lines of the file
+    dtype = np.float64 if columns == 3 else np.int64
+    commentBytes = comment.encode()
+    with open(path, "rb") as f:
+        leftover = b""
+        while True:
+            data = f.read(CHUNK_BYTES)
+            if not data:
+                break
+            data = leftover + data
+            cut = data.rfind(b"\n") + 1
+            if cut == 0:
+                leftover = data
+                continue
+            leftover = data[cut:]
+            yield _parse_lines(data[:cut], dtype, columns, commentBytes)
+        if leftover.strip():
+            yield _parse_lines(leftover, dtype, columns, commentBytes)
+
+
+def _parse_lines(text, dtype, columns, commentBytes):
+    if commentBytes and commentBytes in text:
+        text = _blank_comment_lines(text, commentBytes)
+    if text.isspace():
+        # np.fromstring reads a lone 0 out of pure whitespace
+        return np.empty((0, columns), dtype=dtype)
+    values = np.fromstring(text.decode("ascii"), dtype=dtype, sep=" ")
+    if values.size % columns:
+        raise ValueError(f"edge list lines must have {columns} columns")
+    return values.reshape(-1, columns)
+
+
+def _blank_comment_lines(text, commentBytes):
+    # Overwrites comment lines with spaces in one copy of the chunk; the loop
+    # runs once per line holding the comment character, not once per line
+    data = bytearray(text)
+    pos = text.find(commentBytes)
+    while pos != -1:
+        lineStart = text.rfind(b"\n", 0, pos) + 1
+        lineEnd = text.find(b"\n", pos)
+        if lineEnd == -1:
+            lineEnd = len(text)
+        if not text[lineStart:pos].strip():
+            data[lineStart:lineEnd] = b" " * (lineEnd - lineStart)
+        pos = text.find(commentBytes, lineEnd)
+    return data
+
+
+def _memmap(path, dtype, offset, count):
+    # np.memmap can't map zero bytes
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+
+
+def _raw_bytes(values, typecode):
+    if np is not None and isinstance(values, np.ndarray):
+        return np.ascontiguousarray(values, dtype="<i8" if typecode == INDEX_TYPE else "<f8").tobytes()
+    if not isinstance(values, array):
+        values = array(typecode, values)
+    return values.tobytes()
+
+
+def _read_array(f, typecode, count):
+    values = array(typecode)
+    values.fromfile(f, count)
+    return values
+
+
+# Main part of the script
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import time
+
+    V, E = 100000, 1000000
+    with tempfile.TemporaryDirectory() as workDir:
+        textPath = os.path.join(workDir, "edges.txt")
+        with open(textPath, "w") as f:
+            f.write("# u v weight\n")
+            for _ in range(E):
+                f.write(f"{random.randrange(V)} {random.randrange(V)} {random.randint(1, 100)}\n")
+
+        startTime = time.perf_counter()
+        graph = load_edge_list(textPath, weighted=True)
+        print(f"Parsed {graph} from text in {time.perf_counter() - startTime:.3f}s")
+
+        binaryPath = os.path.join(workDir, "edges.csr")
+        save_graph(graph, binaryPath)
+        startTime = time.perf_counter()
+        loaded = load_graph(binaryPath)
+        print(f"Reloaded {loaded} from binary in {(time.perf_counter() - startTime) * 1000:.2f}ms")
+        print(f"Neighbors of node 0: {list(loaded.neighbors(0))}")
+        del loaded
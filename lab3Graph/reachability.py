@@ -0,0 +1,247 @@
+import random
+import sys
+from array import array
+
+from csrGraph import CSRGraph, INDEX_TYPE
+from directedGraphs import strongly_connected_components
+from traversal import as_csr
+
+CLOSURE_MAX_COMPONENTS = 20000   # C x C bits of closure is 50 MB at this size
+INTERVAL_LABELINGS = 3           # random DFS labelings kept by the interval index
+
+
+class ReachabilityIndex:
+    """
+    Answers "can u reach v?" for a static graph without a traversal per
+    query.
+
+    The graph is first condensed: every strongly connected component (for
+    an undirected graph, every connected component) becomes one node, which
+    turns it into a DAG. Two nodes in the same component always reach each
+    other. Across components one of two indexes is used:
+
+    - "closure": the transitive closure of the DAG as one bitset per
+      component, filled sinks first so each row is its own bit ORed with
+      the rows of its successors (Warshall's algorithm in DAG order).
+      Queries are a single bit test; it costs C^2 bits for C components.
+    - "interval": a few DFS post-order labelings of the DAG. Each gives
+      every component an interval that contains the interval of everything
+      it reaches, so a missing containment proves "no", and a DFS tree
+      containment proves "yes". Only the rare queries neither check
+      decides fall back to a search that prunes with the same intervals.
+      It costs O(C) memory.
+
+    "auto" uses the closure for up to CLOSURE_MAX_COMPONENTS components.
+    """
+
+    def __init__(self, graph, method="auto", seed=1240):
+        graph = as_csr(graph)
+        self.num_nodes = graph.num_nodes
+        self.num_components, self.labels = strongly_connected_components(graph)
+        self.dag = _condense(graph, self.num_components, self.labels)
+        if method == "auto":
+            method = "closure" if self.num_components <= CLOSURE_MAX_COMPONENTS else "interval"
+        if method == "closure":
+            self.rows = _closure_rows(self.dag)
+        elif method == "interval":
+            rng = random.Random(seed)
+            self.intervals = [_interval_labels(self.dag, rng, shuffle=k > 0)
+                              for k in range(INTERVAL_LABELINGS)]
+        else:
+            raise ValueError(f"unknown reachability method {method!r}")
+        self.method = method
+        self.memory_bytes = self._memory_footprint()
+
+    @classmethod
+    def from_matrix(cls, adj_matrix, method="auto"):
+        """
+        Builds the index for an adjacency matrix such as the ones filled in
+        by add_edge.
+
+        Args:
+            adj_matrix (list): A V x V list of lists where 1 marks an edge.
+            method (str): "auto", "closure" or "interval".
+
+        Returns:
+            ReachabilityIndex: The new index.
+        """
+        return cls(CSRGraph.from_matrix(adj_matrix), method)
+
+    def reaches(self, u, v):
+        """
+        Checks whether there is a path from u to v (every node reaches
+        itself).
+
+        Args:
+            u (int): The start node.
+            v (int): The end node.
+
+        Returns:
+            bool: True if v can be reached from u.
+        """
+        cu, cv = self.labels[u], self.labels[v]
+        if cu == cv:
+            return True
+        # Edges of the condensed graph always go to lower labels
+        if cu < cv:
+            return False
+        if self.method == "closure":
+            return (self.rows[cu] >> cv) & 1 == 1
+        return self._search(cu, cv)
+
+    def _contains(self, a, b):
+        # True unless some labeling proves that a can't reach b
+        for low, post, _ in self.intervals:
+            if low[b] < low[a] or post[b] > post[a]:
+                return False
+        return True
+
+    def _in_tree(self, a, b):
+        # b lies in a's subtree of the first DFS tree, so a reaches b
+        _, post, start = self.intervals[0]
+        return start[a] <= post[b] <= post[a]
+
+    def _search(self, cu, cv):
+        if self._in_tree(cu, cv):
+            return True
+        if not self._contains(cu, cv):
+            return False
+        offsets = self.dag.offsets
+        targets = self.dag.targets
+        seen = {cu}
+        stack = [cu]
+        while stack:
+            c = stack.pop()
+            for k in range(offsets[c], offsets[c + 1]):
+                d = targets[k]
+                if d == cv or self._in_tree(d, cv):
+                    return True
+                if d not in seen and d > cv and self._contains(d, cv):
+                    seen.add(d)
+                    stack.append(d)
+        return False
+
+    def _memory_footprint(self):
+        total = _array_bytes(self.labels, self.dag.offsets, self.dag.targets)
+        if self.method == "closure":
+            total += sys.getsizeof(self.rows) + sum(sys.getsizeof(row) for row in self.rows)
+        else:
+            for labeling in self.intervals:
+                total += _array_bytes(*labeling)
+        return total
+
+    def __repr__(self):
+        return (f"ReachabilityIndex({self.num_nodes} nodes, {self.num_components} components, "
+                f"{self.method}, {self.memory_bytes / 1024:.1f} KiB)")
+
+
+def _array_bytes(*arrays):
+    return sum(len(a) * a.itemsize for a in arrays)
+
+
+def _condense(graph, count, labels):
+    # One arc per pair of components joined by at least one edge
+    offsets = graph.offsets
+    targets = graph.targets
+    arcs = []
+    for u in range(graph.num_nodes):
+        cu = labels[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            cv = labels[targets[k]]
+            if cu != cv:
+                arcs.append((cu, cv))
+    return CSRGraph.from_edges(count, arcs, directed=True)
+
+
+def _closure_rows(dag):
+    # Successors always have lower labels, so their rows are already done
+    offsets = dag.offsets
+    targets = dag.targets
+    rows = []
+    for c in range(dag.num_nodes):
+        row = 1 << c
+        for k in range(offsets[c], offsets[c + 1]):
+            row |= rows[targets[k]]
+        rows.append(row)
+    return rows
+
+
+def _interval_labels(dag, rng, shuffle):
+    # DFS post-order numbers; low[c] is the smallest post number c can
+    # reach and start[c] the first post number inside c's own DFS subtree
+    offsets = dag.offsets
+    targets = dag.targets
+    C = dag.num_nodes
+    post = array(INDEX_TYPE, bytes(8 * C))
+    start = array(INDEX_TYPE, bytes(8 * C))
+    visited = bytearray(C)
+
+    def children(c):
+        found = targets[offsets[c]:offsets[c + 1]].tolist()
+        if shuffle:
+            rng.shuffle(found)
+        return iter(found)
+
+    roots = list(range(C - 1, -1, -1))
+    if shuffle:
+        rng.shuffle(roots)
+    counter = 0
+    for root in roots:
+        if visited[root]:
+            continue
+        visited[root] = 1
+        start[root] = counter
+        stack = [(root, children(root))]
+        while stack:
+            node, pending = stack[-1]
+            for child in pending:
+                if not visited[child]:
+                    visited[child] = 1
+                    start[child] = counter
+                    stack.append((child, children(child)))
+                    break
+            else:
+                stack.pop()
+                post[node] = counter
+                counter += 1
+
+    # Successors have lower labels, so their low values are already known
+    low = array(INDEX_TYPE, post)
+    for c in range(C):
+        for k in range(offsets[c], offsets[c + 1]):
+            if low[targets[k]] < low[c]:
+                low[c] = low[targets[k]]
+    return low, post, start
+
+
+# Main part of the script
+if __name__ == "__main__":
+    import time
+
+    from lab3Graphs import add_edge
+
+    # Same graph as the lab3Graphs demo: node 4 is disconnected
+    V = 5
+    adj_matrix = [[0] * V for _ in range(V)]
+    add_edge(adj_matrix, 0, 1)
+    add_edge(adj_matrix, 0, 2)
+    add_edge(adj_matrix, 1, 3)
+    add_edge(adj_matrix, 2, 3)
+    index = ReachabilityIndex.from_matrix(adj_matrix)
+    print(index)
+    print(f"0 reaches 3: {index.reaches(0, 3)}, 0 reaches 4: {index.reaches(0, 4)}")
+
+    # A random directed graph, indexed both ways
+    V = 20000
+    edges = [(random.randrange(V), random.randrange(V)) for _ in range(24000)]
+    graph = CSRGraph.from_edges(V, edges, directed=True)
+    queries = [(random.randrange(V), random.randrange(V)) for _ in range(200000)]
+    for method in ("closure", "interval"):
+        startTime = time.perf_counter()
+        index = ReachabilityIndex(graph, method)
+        buildTime = time.perf_counter() - startTime
+        startTime = time.perf_counter()
+        found = sum(index.reaches(u, v) for u, v in queries)
+        queryTime = time.perf_counter() - startTime
+        print(f"{index}: built in {buildTime:.2f}s, "
+              f"{len(queries)} queries ({found} reachable) in {queryTime:.2f}s")
@@ -0,0 +1,197 @@
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from csrGraph import INDEX_TYPE, WEIGHT_TYPE
+from traversal import as_csr
+
+
+def rcm_order(graph):
+    """
+    Reverse Cuthill-McKee ordering: a breadth first order that starts each
+    component at a low-degree node and visits neighbors lowest degree
+    first, then reversed. Neighbors end up with nearby ids, which keeps the
+    adjacency rows a traversal touches close together in memory.
+
+    Args:
+        graph: A CSRGraph or an adjacency list.
+
+    Returns:
+        array: order[newId] = oldId.
+    """
+    graph = as_csr(graph)
+    offsets = graph.offsets
+    targets = graph.targets
+    V = graph.num_nodes
+    degree = [int(offsets[u + 1] - offsets[u]) for u in range(V)]
+    visited = bytearray(V)
+    order = array(INDEX_TYPE)
+    # Start every component from its lowest degree node
+    for root in sorted(range(V), key=degree.__getitem__):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        queue = deque([root])
+        while queue:
+            u = queue.popleft()
+            order.append(u)
+            fresh = [v for v in targets[offsets[u]:offsets[u + 1]].tolist() if not visited[v]]
+            fresh.sort(key=degree.__getitem__)
+            for v in fresh:
+                visited[v] = 1
+            queue.extend(fresh)
+    order.reverse()
+    return order
+
+
+def bfs_order(graph, start_node=0):
+    """
+    Breadth first ordering, continuing from the smallest unvisited node for
+    each further component.
+
+    Args:
+        graph: A CSRGraph or an adjacency list.
+        start_node (int): The node that gets new id 0.
+
+    Returns:
+        array: order[newId] = oldId.
+    """
+    graph = as_csr(graph)
+    offsets = graph.offsets
+    targets = graph.targets
+    V = graph.num_nodes
+    visited = bytearray(V)
+    order = array(INDEX_TYPE)
+    for root in [start_node] + list(range(V)):
+        if V == 0 or visited[root]:
+            continue
+        visited[root] = 1
+        queue = deque([root])
+        while queue:
+            u = queue.popleft()
+            order.append(u)
+            for v in targets[offsets[u]:offsets[u + 1]].tolist():
+                if not visited[v]:
+                    visited[v] = 1
+                    queue.append(v)
+    return order
+
+
+def degree_order(graph):
+    """
+    Orders nodes by descending degree, so the hubs most traversals pass
+    through share the first cache lines of every per-node array.
+
+    Args:
+        graph: A CSRGraph or an adjacency list.
+
+    Returns:
+        array: order[newId] = oldId.
+    """
+    graph = as_csr(graph)
+    offsets = graph.offsets
+    V = graph.num_nodes
+    return array(INDEX_TYPE, sorted(range(V), key=lambda u: offsets[u] - offsets[u + 1]))
+
+
+def relabel(graph, order):
+    """
+    Renumbers the nodes of a CSRGraph in place so that node order[i] becomes
+    node i, keeping every row sorted.
+
+    Args:
+        graph (CSRGraph): The graph to renumber.
+        order: A permutation of the node ids, order[newId] = oldId, such as
+               rcm_order returns.
+
+    Returns:
+        array: new_id[oldId] = newId. Use it to translate node ids into the
+               relabeled graph (e.g. a start node), and order to translate
+               results back (old = order[new]).
+    """
+    V = graph.num_nodes
+    new_id = array(INDEX_TYPE, bytes(8 * V))
+    for newId in range(V):
+        new_id[order[newId]] = newId
+
+    if np is not None:
+        _relabel_numpy(graph, order, new_id)
+        return new_id
+
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    newOffsets = array(INDEX_TYPE, [0])
+    newTargets = array(INDEX_TYPE)
+    newWeights = array(WEIGHT_TYPE) if weights is not None else None
+    for newId in range(V):
+        old = order[newId]
+        start, end = offsets[old], offsets[old + 1]
+        if weights is None:
+            newTargets.extend(sorted(new_id[v] for v in targets[start:end]))
+        else:
+            row = sorted(zip((new_id[v] for v in targets[start:end]), weights[start:end]))
+            newTargets.extend(v for v, _ in row)
+            newWeights.extend(w for _, w in row)
+        newOffsets.append(len(newTargets))
+    graph.offsets, graph.targets, graph.weights = newOffsets, newTargets, newWeights
+    return new_id
+
+
+def _relabel_numpy(graph, order, new_id):
+    offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+    targets = np.frombuffer(graph.targets, dtype=np.int64)
+    order = np.frombuffer(order, dtype=np.int64) if isinstance(order, array) else np.asarray(order, dtype=np.int64)
+    newOf = np.frombuffer(new_id, dtype=np.int64)
+    degrees = np.diff(offsets)
+    sources = newOf[np.repeat(np.arange(graph.num_nodes), degrees)]
+    dests = newOf[targets]
+    # Sort arcs by (new source, new target)
+    arcOrder = np.lexsort((dests, sources))
+    newOffsets = np.zeros(graph.num_nodes + 1, dtype=np.int64)
+    np.cumsum(degrees[order], out=newOffsets[1:])
+    graph.offsets = array(INDEX_TYPE, newOffsets.tobytes())
+    graph.targets = array(INDEX_TYPE, dests[arcOrder].tobytes())
+    if graph.weights is not None:
+        weights = np.frombuffer(graph.weights, dtype=np.float64)
+        graph.weights = array(WEIGHT_TYPE, weights[arcOrder].tobytes())
+
+
+def bandwidth(graph):
+    """
+    Largest |u - v| over all edges: a rough measure of how far apart in
+    memory the rows touched around any one node are.
+
+    Args:
+        graph: A CSRGraph or an adjacency list.
+
+    Returns:
+        int: The bandwidth of the adjacency matrix.
+    """
+    graph = as_csr(graph)
+    offsets = graph.offsets
+    targets = graph.targets
+    widest = 0
+    for u in range(graph.num_nodes):
+        start, end = offsets[u], offsets[u + 1]
+        if start < end:
+            widest = max(widest, u - targets[start], targets[end - 1] - u)
+    return int(widest)
+
+
+# Main part of the script
+if __name__ == "__main__":
+    from csrGraph import CSRGraph
+
+    # Same graph as the lab3Graphs demo: node 4 is disconnected
+    graph = CSRGraph.from_edges(5, [(0, 1), (0, 2), (1, 3), (2, 3)])
+    order = rcm_order(graph)
+    new_id = relabel(graph, order)
+    print(f"RCM order (new -> old): {order.tolist()}")
+    print(f"Relabeled adjacency list: {graph.to_adj_list()}")
+    path = graph.dfs_traversal(new_id[0])
+    print(f"Traversal from old node 0, in old ids: {[order[u] for u in path]}")
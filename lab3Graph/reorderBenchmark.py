@@ -0,0 +1,63 @@
+import random
+import time
+
+from csrGraph import CSRGraph
+from frontierBfs import frontier_bfs
+from reorder import bandwidth, bfs_order, degree_order, rcm_order, relabel
+from traversal import connected_components
+
+
+def scrambled_grid(side, seed=1240):
+    """
+    Builds a side x side grid graph (a stand-in for road-like graphs with
+    good natural locality) and gives its nodes random ids, the way ids
+    from an arbitrary source usually look.
+
+    Args:
+        side (int): Nodes per grid row and column.
+        seed (int): Seed for the random generator so runs are repeatable.
+
+    Returns:
+        CSRGraph: The scrambled grid.
+    """
+    rng = random.Random(seed)
+    V = side * side
+    ids = list(range(V))
+    rng.shuffle(ids)
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            u = ids[r * side + c]
+            if c + 1 < side:
+                edges.append((u, ids[r * side + c + 1]))
+            if r + 1 < side:
+                edges.append((u, ids[(r + 1) * side + c]))
+    return CSRGraph.from_edges(V, edges)
+
+
+def time_traversals(graph, repeats=3):
+    # Best of a few runs of each traversal, in seconds
+    timings = {}
+    for name, run in (("dfs", lambda: graph.dfs_traversal(0)),
+                      ("components", lambda: connected_components(graph)),
+                      ("frontier bfs", lambda: frontier_bfs(graph, 0))):
+        best = float("inf")
+        for _ in range(repeats):
+            startTime = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - startTime)
+        timings[name] = best
+    return timings
+
+
+if __name__ == "__main__":
+    side = 700
+    print(f"{side} x {side} grid with random node ids")
+    print(f"{'order':>10} {'bandwidth':>10} {'dfs':>8} {'components':>11} {'frontier bfs':>13}   (s)")
+    for name, make_order in (("original", None), ("rcm", rcm_order), ("bfs", bfs_order), ("degree", degree_order)):
+        graph = scrambled_grid(side)
+        if make_order is not None:
+            relabel(graph, make_order(graph))
+        timings = time_traversals(graph)
+        print(f"{name:>10} {bandwidth(graph):>10} {timings['dfs']:8.3f} "
+              f"{timings['components']:11.3f} {timings['frontier bfs']:13.3f}")
@@ -0,0 +1,142 @@
+from array import array
+from collections import deque
+
+from csrGraph import CSRGraph, INDEX_TYPE
+
+
+def as_csr(graph):
+    """
+    Returns graph as a CSRGraph, converting an adjacency list if needed.
+
+    Conversion sorts every neighbor list once, so the traversals below
+    never sort while they run.
+
+    Args:
+        graph: A CSRGraph or an adjacency list (list of neighbor lists).
+
+    Returns:
+        CSRGraph: The graph in CSR form.
+    """
+    if isinstance(graph, CSRGraph):
+        return graph
+    return CSRGraph.from_adj_list(graph)
+
+
+def dfs(graph, start_node):
+    """
+    Lazily yields nodes in depth first order from start_node, in the same
+    order as dfs_traversal in lab3Graphs (smallest neighbor first).
+
+    Args:
+        graph: A CSRGraph or an adjacency list.
+        start_node (int): The node to start from.
+
+    Yields:
+        int: Each reachable node, in visiting order.
+    """
+    graph = as_csr(graph)
+    offsets = graph.offsets
+    targets = graph.targets
+    visited = bytearray(graph.num_nodes)
+    visited[start_node] = 1
+    stack = [start_node]
+    while stack:
+        current_node = stack.pop()
+        yield current_node
+        for k in range(offsets[current_node + 1] - 1, offsets[current_node] - 1, -1):
+            neighbor = targets[k]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                stack.append(neighbor)
+
+
+def bfs(graph, start_node):
+    """
+    Lazily yields nodes in breadth first order from start_node, smallest
+    neighbor first.
+
+    Args:
+        graph: A CSRGraph or an adjacency list.
+        start_node (int): The node to start from.
+
+    Yields:
+        int: Each reachable node, in visiting order.
+    """
+    graph = as_csr(graph)
+    offsets = graph.offsets
+    targets = graph.targets
+    visited = bytearray(graph.num_nodes)
+    visited[start_node] = 1
+    queue = deque([start_node])
+    while queue:
+        current_node = queue.popleft()
+        yield current_node
+        for k in range(offsets[current_node], offsets[current_node + 1]):
+            neighbor = targets[k]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                queue.append(neighbor)
+
+
+def connected_components(graph):
+    """
+    Labels every connected component of an undirected graph in one
+    O(V + E) pass, including components the start node can't reach (such
+    as the disconnected node 4 in the lab3Graphs demo).
+
+    Components are numbered in order of their smallest node.
+
+    Args:
+        graph: A CSRGraph or an adjacency list.
+
+    Returns:
+        tuple: (number of components, array of component labels per node).
+    """
+    graph = as_csr(graph)
+    offsets = graph.offsets
+    targets = graph.targets
+    V = graph.num_nodes
+    labels = array(INDEX_TYPE, [-1]) * V
+    count = 0
+    stack = []
+    for root in range(V):
+        if labels[root] != -1:
+            continue
+        labels[root] = count
+        stack.append(root)
+        while stack:
+            u = stack.pop()
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if labels[v] == -1:
+                    labels[v] = count
+                    stack.append(v)
+        count += 1
+    return count, labels
+
+
+def component_members(labels, count):
+    """
+    Groups nodes by the labels connected_components returns.
+
+    Args:
+        labels: The component label of every node.
+        count (int): The number of components.
+
+    Returns:
+        list: One ascending list of nodes per component.
+    """
+    members = [[] for _ in range(count)]
+    for node, label in enumerate(labels):
+        members[label].append(node)
+    return members
+
+
+# Main part of the script
+if __name__ == "__main__":
+    # Same graph as the lab3Graphs demo: node 4 is disconnected
+    graph = CSRGraph.from_edges(5, [(0, 1), (0, 2), (1, 3), (2, 3)])
+    print(f"Depth First Traversal from 0: {list(dfs(graph, 0))}")
+    print(f"Breadth First Traversal from 0: {list(bfs(graph, 0))}")
+    count, labels = connected_components(graph)
+    print(f"{count} components: {component_members(labels, count)}")
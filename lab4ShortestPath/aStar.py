@@ -0,0 +1,193 @@
+import heapq
+import random
+from array import array
+
+from bidirectionalDijkstra import reverse_graph
+from shortestPathTree import shortest_path_tree
+
+
+def a_star(graph, start_node, end_node, heuristic=None):
+    """
+    Finds the minimum cost path from start_node to end_node with A*:
+    Dijkstra's algorithm where the queue is ordered by cost so far plus a
+    lower bound on the cost still to go, so nodes in the direction of
+    end_node are settled first.
+
+    The heuristic must never overestimate the remaining cost (admissible)
+    for the result to be a shortest path. Without one, this is dijkstra.
+
+    Args:
+        graph (dict): A dictionary representing the graph where keys are nodes
+                      and values are dictionaries of neighboring nodes and their weights.
+        start_node: The starting node.
+        end_node: The ending node.
+        heuristic (callable): heuristic(node) returns a lower bound on the
+                              cost from node to end_node, such as the one
+                              Landmarks.heuristic(end_node) returns.
+
+    Returns:
+        tuple: A tuple containing the shortest path as a list and its total cost.
+               Returns (None, float('inf')) if no path exists.
+    """
+    inf = float('inf')
+    if heuristic is None:
+        heuristic = lambda node: 0
+    distances = {start_node: 0}
+    predecessors = {start_node: None}
+    priority_queue = [(heuristic(start_node), 0, start_node)]
+
+    while priority_queue:
+        _, current_cost, current_node = heapq.heappop(priority_queue)
+
+        if current_node == end_node:
+            break
+
+        if current_cost > distances[current_node]:
+            continue
+
+        for neighbor, weight in graph[current_node].items():
+            cost = current_cost + weight
+
+            if cost < distances.get(neighbor, inf):
+                bound = heuristic(neighbor)
+                distances[neighbor] = cost
+                predecessors[neighbor] = current_node
+                # An infinite bound means end_node can't be reached from here
+                if bound != inf:
+                    heapq.heappush(priority_queue, (cost + bound, cost, neighbor))
+
+    if end_node not in distances:
+        return None, inf
+
+    path = []
+    current = end_node
+    while current is not None:
+        path.append(current)
+        current = predecessors[current]
+    path.reverse()
+    return path, distances[end_node]
+
+
+class Landmarks:
+    """
+    ALT preprocessing (A*, landmarks and the triangle inequality): exact
+    distances from and to a few landmark nodes, from which a lower bound
+    between any two nodes follows. For a landmark L and a path from v to t,
+
+        d(v, t) >= d(L, t) - d(L, v)    and    d(v, t) >= d(v, L) - d(t, L)
+
+    and the largest of these over all landmarks is the A* heuristic.
+    Landmarks on the far edges of the graph give the tightest bounds, so
+    each new one is the node farthest from the ones already picked.
+
+    Distances are kept as one array('d') per landmark and direction,
+    indexed by the node's position in the graph dict.
+    """
+
+    def __init__(self, graph, k=8, seed=1240):
+        """
+        Picks k landmarks and runs two full Dijkstra searches from each.
+
+        Args:
+            graph (dict): The graph, as for dijkstra.
+            k (int): Number of landmarks.
+            seed (int): Seed for picking the first landmark.
+        """
+        inf = float('inf')
+        reverse = reverse_graph(graph)
+        self.position = {node: i for i, node in enumerate(graph)}
+        nodes = list(self.position)
+        self.landmarks = []
+        self.from_landmark = []   # from_landmark[i][v] = d(landmark i, v)
+        self.to_landmark = []     # to_landmark[i][v] = d(v, landmark i)
+        # Smallest distance from any landmark so far, for picking the next
+        closest = array('d', [inf]) * len(nodes)
+        landmark = random.Random(seed).choice(nodes) if nodes else None
+
+        for _ in range(min(k, len(nodes))):
+            self.landmarks.append(landmark)
+            self.from_landmark.append(self._distance_array(shortest_path_tree(graph, landmark)))
+            self.to_landmark.append(self._distance_array(shortest_path_tree(reverse, landmark)))
+            distances = self.from_landmark[-1]
+            farthest, landmark = -1, None
+            for i, node in enumerate(nodes):
+                if distances[i] < closest[i]:
+                    closest[i] = distances[i]
+                # Unreachable nodes are skipped; they'd give no bound at all
+                if farthest < closest[i] < inf and node not in self.landmarks:
+                    farthest, landmark = closest[i], node
+            if landmark is None:
+                break
+
+    def _distance_array(self, tree):
+        distances = array('d', [float('inf')]) * len(self.position)
+        for node, distance in tree.distances.items():
+            distances[self.position[node]] = distance
+        return distances
+
+    def lower_bound(self, node, end_node):
+        """
+        A lower bound on the cost of the shortest path from node to
+        end_node (float('inf') when end_node can't be reached from node).
+        """
+        return self.heuristic(end_node)(node)
+
+    def heuristic(self, end_node):
+        """
+        Builds the A* heuristic for queries to end_node.
+
+        Args:
+            end_node: The node every query will end at.
+
+        Returns:
+            callable: heuristic(node) returning a lower bound on the cost
+                      from node to end_node.
+        """
+        inf = float('inf')
+        t = self.position[end_node]
+        # (distances from L, d(L, t), distances to L, d(t, L)) per landmark
+        terms = [(fromL, fromL[t], toL, toL[t])
+                 for fromL, toL in zip(self.from_landmark, self.to_landmark)]
+        position = self.position
+
+        def bound(node):
+            v = position[node]
+            best = 0
+            for fromL, fromLT, toL, toLT in terms:
+                fromLV = fromL[v]
+                # L reaches v but not t, so v can't reach t either
+                if fromLT == inf and fromLV != inf:
+                    return inf
+                if fromLT != inf and fromLT - fromLV > best:
+                    best = fromLT - fromLV
+                toLV = toL[v]
+                # t reaches L but v doesn't, so v can't reach t either
+                if toLV == inf and toLT != inf:
+                    return inf
+                if toLT != inf and toLV - toLT > best:
+                    best = toLV - toLT
+            return best
+
+        return bound
+
+    def shortest_path(self, graph, start_node, end_node):
+        """
+        Runs a_star with the landmark heuristic. Returns the same cost as
+        dijkstra(graph, start_node, end_node).
+        """
+        return a_star(graph, start_node, end_node, self.heuristic(end_node))
+
+    def __repr__(self):
+        return f"Landmarks({len(self.landmarks)} landmarks over {len(self.position)} nodes)"
+
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    from lab4ShortestPath import dijkstra, graph
+
+    start = 0
+    end = 9
+    landmarks = Landmarks(graph, k=3)
+    print(landmarks, landmarks.landmarks)
+    print(f"dijkstra: {dijkstra(graph, start, end)}")
+    print(f"ALT:      {landmarks.shortest_path(graph, start, end)}")
@@ -0,0 +1,44 @@
+import random
+import sys
+import time
+
+from aStar import Landmarks
+from bidirectionalBenchmark import CountingGraph, grid_graph
+from lab4ShortestPath import dijkstra
+
+
+if __name__ == "__main__":
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    k = int(sys.argv[3]) if len(sys.argv) > 3 else 16
+    graph = CountingGraph(grid_graph(side))
+    print(f"{side} x {side} grid ({len(graph)} nodes), {k} landmarks, {queries} random queries")
+
+    startTime = time.perf_counter()
+    landmarks = Landmarks(graph, k)
+    print(f"Landmark preprocessing: {time.perf_counter() - startTime:.2f}s")
+    print(f"{'query':>16} {'dijkstra settled':>17} {'ALT settled':>12} {'ratio':>6} {'dijkstra s':>11} {'ALT s':>6}")
+
+    rng = random.Random(1)
+    totals = [0, 0]
+    for _ in range(queries):
+        start, end = rng.randrange(len(graph)), rng.randrange(len(graph))
+
+        graph.lookups = 0
+        startTime = time.perf_counter()
+        path, cost = dijkstra(graph, start, end)
+        dijkstraTime = time.perf_counter() - startTime
+        dijkstraSettled = graph.lookups
+
+        graph.lookups = 0
+        startTime = time.perf_counter()
+        altPath, altCost = landmarks.shortest_path(graph, start, end)
+        altTime = time.perf_counter() - startTime
+        altSettled = graph.lookups
+
+        assert altCost == cost
+        totals[0] += dijkstraSettled
+        totals[1] += altSettled
+        print(f"{start:>7} -> {end:<6} {dijkstraSettled:>17} {altSettled:>12} "
+              f"{dijkstraSettled / max(1, altSettled):6.1f} {dijkstraTime:11.3f} {altTime:6.3f}")
+    print(f"Overall: {totals[0] / max(1, totals[1]):.1f}x fewer settled nodes")
@@ -0,0 +1,76 @@
+import random
+import sys
+import time
+
+from bidirectionalDijkstra import bidirectional_dijkstra, reverse_graph
+from lab4ShortestPath import dijkstra
+
+
+class CountingGraph(dict):
+    """
+    A graph dict that counts how often a node's neighbors are looked up.
+    Both searches look up each node once when they settle it, so the count
+    is the number of settled nodes.
+    """
+
+    lookups = 0
+
+    def __getitem__(self, node):
+        self.lookups += 1
+        return dict.__getitem__(self, node)
+
+
+def grid_graph(side, seed=1240):
+    """
+    Builds a side x side grid where every node links to its four neighbors
+    with random weights from 1 to 10, in both directions: a stand-in for a
+    road network.
+
+    Args:
+        side (int): Nodes per grid row and column.
+        seed (int): Seed for the random generator so runs are repeatable.
+
+    Returns:
+        dict: The graph, in the same form dijkstra takes.
+    """
+    rng = random.Random(seed)
+    graph = {node: {} for node in range(side * side)}
+    for r in range(side):
+        for c in range(side):
+            u = r * side + c
+            if c + 1 < side:
+                graph[u][u + 1] = rng.randint(1, 10)
+                graph[u + 1][u] = rng.randint(1, 10)
+            if r + 1 < side:
+                graph[u][u + side] = rng.randint(1, 10)
+                graph[u + side][u] = rng.randint(1, 10)
+    return graph
+
+
+if __name__ == "__main__":
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    graph = CountingGraph(grid_graph(side))
+    reverse = CountingGraph(reverse_graph(graph))
+    print(f"{side} x {side} grid ({len(graph)} nodes), {queries} random queries")
+    print(f"{'query':>18} {'dijkstra settled':>17} {'bidirectional':>14} {'ratio':>6} {'dijkstra s':>11} {'bidir s':>8}")
+
+    rng = random.Random(1)
+    for _ in range(queries):
+        start, end = rng.randrange(len(graph)), rng.randrange(len(graph))
+
+        graph.lookups = 0
+        startTime = time.perf_counter()
+        path, cost = dijkstra(graph, start, end)
+        dijkstraTime = time.perf_counter() - startTime
+        dijkstraSettled = graph.lookups
+
+        graph.lookups = reverse.lookups = 0
+        startTime = time.perf_counter()
+        biPath, biCost = bidirectional_dijkstra(graph, start, end, reverse)
+        biTime = time.perf_counter() - startTime
+        biSettled = graph.lookups + reverse.lookups
+
+        assert biCost == cost
+        print(f"{start:>8} -> {end:<7} {dijkstraSettled:>17} {biSettled:>14} "
+              f"{dijkstraSettled / max(1, biSettled):6.2f} {dijkstraTime:11.2f} {biTime:8.2f}")
@@ -0,0 +1,114 @@
+import heapq
+
+
+def reverse_graph(graph):
+    """
+    Builds the graph with every edge turned around, for searching backward
+    from an end node. float('inf') weights mark missing edges and are left
+    out.
+
+    Args:
+        graph (dict): A dictionary representing the graph where keys are nodes
+                      and values are dictionaries of neighboring nodes and their weights.
+
+    Returns:
+        dict: reverse[v][u] is the weight of the edge u -> v.
+    """
+    inf = float('inf')
+    reverse = {node: {} for node in graph}
+    for node, neighbors in graph.items():
+        for neighbor, weight in neighbors.items():
+            if weight != inf:
+                reverse.setdefault(neighbor, {})[node] = weight
+    return reverse
+
+
+def bidirectional_dijkstra(graph, start_node, end_node, reverse=None):
+    """
+    Finds the minimum cost path from start_node to end_node by running
+    Dijkstra's algorithm forward from start_node and backward from
+    end_node at the same time, always advancing the side whose next node
+    is closer.
+
+    Every edge scanned from one side to a node the other side has reached
+    gives a candidate path. The search stops once the two queue minimums
+    add up to at least the best candidate, since no path through an
+    unsettled node can be shorter. Both searches only cover about half the
+    distance, which on road-like graphs settles far fewer nodes.
+
+    Args:
+        graph (dict): A dictionary representing the graph where keys are nodes
+                      and values are dictionaries of neighboring nodes and their weights.
+        start_node: The starting node.
+        end_node: The ending node.
+        reverse (dict): reverse_graph(graph), if already built. Pass it in
+                        when running many queries against the same graph.
+
+    Returns:
+        tuple: A tuple containing the shortest path as a list and its total cost.
+               Returns (None, float('inf')) if no path exists. When several
+               paths tie, the path may differ from dijkstra's, the cost won't.
+    """
+    if start_node == end_node:
+        return [start_node], 0
+    if reverse is None:
+        reverse = reverse_graph(graph)
+
+    inf = float('inf')
+    graphs = (graph, reverse)
+    distances = ({start_node: 0}, {end_node: 0})
+    predecessors = ({start_node: None}, {end_node: None})
+    queues = ([(0, start_node)], [(0, end_node)])
+    best_cost = inf
+    meeting = None      # (node on the forward side, node on the backward side)
+
+    while queues[0] and queues[1]:
+        forward_top = queues[0][0][0]
+        backward_top = queues[1][0][0]
+        if forward_top + backward_top >= best_cost:
+            break
+
+        side = 0 if forward_top <= backward_top else 1
+        current_cost, current_node = heapq.heappop(queues[side])
+        if current_cost > distances[side][current_node]:
+            continue
+
+        own = distances[side]
+        other = distances[1 - side]
+        for neighbor, weight in graphs[side][current_node].items():
+            cost = current_cost + weight
+
+            if cost < own.get(neighbor, inf):
+                own[neighbor] = cost
+                predecessors[side][neighbor] = current_node
+                heapq.heappush(queues[side], (cost, neighbor))
+
+            if neighbor in other and cost + other[neighbor] < best_cost:
+                best_cost = cost + other[neighbor]
+                meeting = (current_node, neighbor) if side == 0 else (neighbor, current_node)
+
+    if meeting is None:
+        return None, inf
+
+    # Forward predecessors back to start_node, then backward ones to end_node
+    path = []
+    current = meeting[0]
+    while current is not None:
+        path.append(current)
+        current = predecessors[0][current]
+    path.reverse()
+    current = meeting[1]
+    while current is not None:
+        path.append(current)
+        current = predecessors[1][current]
+    return path, best_cost
+
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    from lab4ShortestPath import dijkstra, graph
+
+    start = 0
+    end = 9
+    print(f"dijkstra:               {dijkstra(graph, start, end)}")
+    print(f"bidirectional_dijkstra: {bidirectional_dijkstra(graph, start, end)}")
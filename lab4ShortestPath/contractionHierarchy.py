@@ -0,0 +1,369 @@
+import heapq
+import struct
+from array import array
+
+INDEX_TYPE = "q"   # int64 node ids and offsets
+WEIGHT_TYPE = "d"  # float64 edge weights
+NO_MIDDLE = -1     # marks an original edge rather than a shortcut
+WITNESS_SETTLE_LIMIT = 200   # nodes a witness search may settle before giving up
+
+MAGIC = b"CHGRAPH1"
+HEADER = struct.Struct("<8sQQQ32x")
+
+
+class ContractionHierarchy:
+    """
+    Contraction hierarchies: a preprocessed graph that answers shortest
+    path queries by searching only a small part of it.
+
+    Preprocessing removes ("contracts") the nodes one at a time, least
+    important first. Whenever removing a node x would break the only
+    shortest path u -> x -> v, a shortcut edge u -> v with the same cost is
+    added. Every node then keeps the edges to the nodes contracted after it
+    (its upward edges), and any shortest path can be found as a path that
+    only goes up from the start and only goes up, backwards, from the end.
+    A query runs Dijkstra's algorithm on both of those upward graphs and
+    expands the shortcuts on the best path back into original edges.
+
+    The hierarchy is stored as two sets of CSR style arrays, one for upward
+    edges out of each node and one for upward edges into each node, where
+    every edge also records the node it skips (NO_MIDDLE for original
+    edges).
+    """
+
+    def __init__(self, nodes, rank, up, down):
+        self.nodes = nodes          # nodes[i] is the graph node with index i
+        self.rank = rank            # contraction order of every node
+        self.up = up                # (offsets, targets, weights, middles) of edges i -> higher
+        self.down = down            # (offsets, sources, weights, middles) of edges higher -> i
+        self.position = {node: i for i, node in enumerate(nodes)}
+
+    @classmethod
+    def build(cls, graph, witness_limit=WITNESS_SETTLE_LIMIT):
+        """
+        Orders and contracts the nodes of graph.
+
+        The next node to contract is the one with the lowest edge
+        difference (shortcuts it needs minus edges it removes) plus the
+        number of its neighbors already contracted, which keeps the
+        contraction spread evenly over the graph. Priorities change as the
+        graph does, so a node is re-checked when it comes off the queue and
+        put back if it is no longer the cheapest.
+
+        Args:
+            graph (dict): A dictionary representing the graph where keys are nodes
+                          and values are dictionaries of neighboring nodes and their weights.
+            witness_limit (int): How many nodes a search for a path around a
+                                 contracted node may settle. Lower is faster
+                                 but adds more (harmless) extra shortcuts.
+
+        Returns:
+            ContractionHierarchy: The preprocessed graph.
+        """
+        inf = float('inf')
+        nodes = list(graph)
+        position = {node: i for i, node in enumerate(nodes)}
+        n = len(nodes)
+        out = [{} for _ in range(n)]
+        into = [{} for _ in range(n)]
+        for node, neighbors in graph.items():
+            u = position[node]
+            for neighbor, weight in neighbors.items():
+                v = position[neighbor]
+                # float('inf') weights mark missing edges
+                if weight != inf and u != v and weight < out[u].get(v, inf):
+                    out[u][v] = weight
+                    into[v][u] = weight
+
+        middle = {}   # (u, v) -> the node a shortcut u -> v skips
+        deleted = [0] * n
+        rank = array(INDEX_TYPE, [0]) * n
+        upArcs = [None] * n
+        downArcs = [None] * n
+        queue = [(_edge_difference(out, into, x, witness_limit, deleted), x) for x in range(n)]
+        heapq.heapify(queue)
+        order = 0
+        while queue:
+            _, x = heapq.heappop(queue)
+            shortcuts = _shortcuts(out, into, x, witness_limit)
+            priority = len(shortcuts) - len(out[x]) - len(into[x]) + deleted[x]
+            if queue and priority > queue[0][0]:
+                heapq.heappush(queue, (priority, x))
+                continue
+
+            rank[x] = order
+            order += 1
+            upArcs[x] = [(v, w, middle.get((x, v), NO_MIDDLE)) for v, w in out[x].items()]
+            downArcs[x] = [(u, w, middle.get((u, x), NO_MIDDLE)) for u, w in into[x].items()]
+            for v in out[x]:
+                del into[v][x]
+                deleted[v] += 1
+            for u in into[x]:
+                del out[u][x]
+                deleted[u] += 1
+            out[x] = into[x] = None
+            for u, v, w in shortcuts:
+                if w < out[u].get(v, inf):
+                    out[u][v] = w
+                    into[v][u] = w
+                    middle[(u, v)] = x
+
+        return cls(nodes, rank, _pack(upArcs), _pack(downArcs))
+
+    @property
+    def num_shortcuts(self):
+        # Every shortcut is stored once, in the lower ranked endpoint's lists
+        return sum(1 for m in self.up[3] if m != NO_MIDDLE) + sum(1 for m in self.down[3] if m != NO_MIDDLE)
+
+    def shortest_path(self, start_node, end_node):
+        """
+        Finds the minimum cost path from start_node to end_node.
+
+        Args:
+            start_node: The starting node.
+            end_node: The ending node.
+
+        Returns:
+            tuple: A tuple containing the shortest path as a list and its total cost.
+                   Returns (None, float('inf')) if no path exists. The cost is a
+                   float, and when several paths tie the path may differ from
+                   dijkstra's.
+        """
+        if start_node == end_node:
+            return [start_node], 0
+        inf = float('inf')
+        s, t = self.position[start_node], self.position[end_node]
+        graphs = (self.up, self.down)
+        distances = ({s: 0.0}, {t: 0.0})
+        predecessors = ({s: None}, {t: None})
+        queues = ([(0.0, s)], [(0.0, t)])
+        best_cost = inf
+        meeting = None
+
+        # Neither side can stop at the first meeting: the top of the
+        # hierarchy may be far above it, so each runs until its queue
+        # minimum reaches the best cost found
+        while True:
+            open_sides = [side for side in (0, 1) if queues[side] and queues[side][0][0] < best_cost]
+            if not open_sides:
+                break
+            side = min(open_sides, key=lambda side: queues[side][0][0])
+            current_cost, current_node = heapq.heappop(queues[side])
+            own = distances[side]
+            if current_cost > own[current_node]:
+                continue
+
+            other = distances[1 - side]
+            if current_node in other and current_cost + other[current_node] < best_cost:
+                best_cost = current_cost + other[current_node]
+                meeting = current_node
+
+            offsets, targets, weights, _ = graphs[side]
+            for k in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = targets[k]
+                cost = current_cost + weights[k]
+                if cost < own.get(neighbor, inf):
+                    own[neighbor] = cost
+                    predecessors[side][neighbor] = current_node
+                    heapq.heappush(queues[side], (cost, neighbor))
+
+        if meeting is None:
+            return None, inf
+
+        # Upward path start -> meeting, then downward meeting -> end
+        hops = []
+        current = meeting
+        while current is not None:
+            hops.append(current)
+            current = predecessors[0][current]
+        hops.reverse()
+        current = predecessors[1][meeting]
+        while current is not None:
+            hops.append(current)
+            current = predecessors[1][current]
+
+        path = [hops[0]]
+        for u, v in zip(hops, hops[1:]):
+            self._unpack(u, v, path)
+        return [self.nodes[i] for i in path], best_cost
+
+    def _middle(self, u, v):
+        # The edge u -> v is stored with whichever endpoint ranks lower
+        if self.rank[u] < self.rank[v]:
+            offsets, targets, _, middles = self.up
+            node, other = u, v
+        else:
+            offsets, targets, _, middles = self.down
+            node, other = v, u
+        for k in range(offsets[node], offsets[node + 1]):
+            if targets[k] == other:
+                return middles[k]
+        raise KeyError(f"no edge {u} -> {v} in the hierarchy")
+
+    def _unpack(self, u, v, path):
+        # Appends the original nodes after u on the edge u -> v, expanding
+        # shortcuts with a stack since they can nest deeply
+        stack = [(u, v)]
+        while stack:
+            a, b = stack.pop()
+            m = self._middle(a, b)
+            if m == NO_MIDDLE:
+                path.append(b)
+            else:
+                stack.append((m, b))
+                stack.append((a, m))
+
+    def save(self, path):
+        """
+        Writes the hierarchy to a binary file: a 64-byte header followed by
+        the raw node ids, ranks and the upward and downward edge arrays.
+        Node ids must be integers.
+
+        Args:
+            path: The file to write.
+        """
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(self.nodes), len(self.up[1]), len(self.down[1])))
+            f.write(array(INDEX_TYPE, self.nodes).tobytes())
+            f.write(self.rank.tobytes())
+            for arrays in (self.up, self.down):
+                for values in arrays:
+                    f.write(values.tobytes())
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads a hierarchy written by save.
+
+        Args:
+            path: The file to read.
+
+        Returns:
+            ContractionHierarchy: The loaded hierarchy.
+        """
+        with open(path, "rb") as f:
+            magic, n, upCount, downCount = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a saved contraction hierarchy")
+            nodes = _read_array(f, INDEX_TYPE, n).tolist()
+            rank = _read_array(f, INDEX_TYPE, n)
+            packed = []
+            for count in (upCount, downCount):
+                packed.append((_read_array(f, INDEX_TYPE, n + 1), _read_array(f, INDEX_TYPE, count),
+                               _read_array(f, WEIGHT_TYPE, count), _read_array(f, INDEX_TYPE, count)))
+        return cls(nodes, rank, packed[0], packed[1])
+
+    def __repr__(self):
+        return f"ContractionHierarchy({len(self.nodes)} nodes, {len(self.up[1]) + len(self.down[1])} edges)"
+
+
+def _witness_distances(out, source, skip, targets, max_cost, limit):
+    # Dijkstra from source that avoids skip and stops once every target is
+    # settled, past max_cost or after settling limit nodes; tentative
+    # distances are real paths too
+    inf = float('inf')
+    distances = {source: 0}
+    queue = [(0, source)]
+    settled = 0
+    remaining = len(targets)
+    while queue:
+        cost, node = heapq.heappop(queue)
+        if cost > distances[node]:
+            continue
+        if cost > max_cost or settled >= limit:
+            break
+        if node in targets:
+            remaining -= 1
+            if remaining == 0:
+                break
+        settled += 1
+        for neighbor, weight in out[node].items():
+            if neighbor == skip:
+                continue
+            new_cost = cost + weight
+            if new_cost < distances.get(neighbor, inf):
+                distances[neighbor] = new_cost
+                heapq.heappush(queue, (new_cost, neighbor))
+    return distances
+
+
+def _shortcuts(out, into, x, limit):
+    # The shortcuts (u, v, cost) contracting x needs: pairs u -> x -> v with
+    # no path around x that costs as little
+    inf = float('inf')
+    shortcuts = []
+    for u, wu in into[x].items():
+        through = {v: wu + wv for v, wv in out[x].items() if v != u}
+        if not through:
+            continue
+        distances = _witness_distances(out, u, x, through, max(through.values()), limit)
+        for v, cost in through.items():
+            if distances.get(v, inf) > cost:
+                shortcuts.append((u, v, cost))
+    return shortcuts
+
+
+def _edge_difference(out, into, x, limit, deleted):
+    return len(_shortcuts(out, into, x, limit)) - len(out[x]) - len(into[x]) + deleted[x]
+
+
+def _pack(arcs):
+    # Per-node lists of (node, weight, middle) to CSR style arrays
+    offsets = array(INDEX_TYPE, [0])
+    targets = array(INDEX_TYPE)
+    weights = array(WEIGHT_TYPE)
+    middles = array(INDEX_TYPE)
+    for nodeArcs in arcs:
+        for v, w, m in nodeArcs:
+            targets.append(v)
+            weights.append(w)
+            middles.append(m)
+        offsets.append(len(targets))
+    return offsets, targets, weights, middles
+
+
+def _read_array(f, typecode, count):
+    values = array(typecode)
+    values.fromfile(f, count)
+    return values
+
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    from bidirectionalBenchmark import grid_graph
+    from lab4ShortestPath import dijkstra, graph
+
+    hierarchy = ContractionHierarchy.build(graph)
+    print(f"{hierarchy}, {hierarchy.num_shortcuts} shortcuts")
+    print(f"dijkstra:               {dijkstra(graph, 0, 9)}")
+    print(f"contraction hierarchy:  {hierarchy.shortest_path(0, 9)}")
+
+    side = 70
+    grid = grid_graph(side)
+    startTime = time.perf_counter()
+    hierarchy = ContractionHierarchy.build(grid)
+    print(f"\n{side} x {side} grid: built {hierarchy} with {hierarchy.num_shortcuts} shortcuts "
+          f"in {time.perf_counter() - startTime:.2f}s")
+
+    with tempfile.TemporaryDirectory() as workDir:
+        chPath = os.path.join(workDir, "grid.ch")
+        hierarchy.save(chPath)
+        startTime = time.perf_counter()
+        hierarchy = ContractionHierarchy.load(chPath)
+        print(f"Saved to {os.path.getsize(chPath)} bytes, reloaded in {time.perf_counter() - startTime:.3f}s")
+
+    rng = random.Random(1)
+    queries = [(rng.randrange(len(grid)), rng.randrange(len(grid))) for _ in range(200)]
+    startTime = time.perf_counter()
+    expected = [dijkstra(grid, s, t)[1] for s, t in queries]
+    dijkstraTime = time.perf_counter() - startTime
+    startTime = time.perf_counter()
+    found = [hierarchy.shortest_path(s, t)[1] for s, t in queries]
+    chTime = time.perf_counter() - startTime
+    assert found == expected
+    print(f"{len(queries)} queries: dijkstra {dijkstraTime:.2f}s, contraction hierarchy {chTime:.2f}s")
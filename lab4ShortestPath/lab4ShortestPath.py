@@ -1,5 +1,6 @@
 import heapq
-import random
+
+from randomGraph import gnp_random_graph, to_dict_graph
 
 def dijkstra(graph, start_node, end_node):
     """
@@ -79,15 +80,10 @@ def display_adjacency_matrix(graph, num_nodes):
 
 # --- Graph Setup ---
 nodes = list(range(10))
-graph = {node: {} for node in nodes}
-for i in nodes:
-    for j in nodes:
-        if i != j:
-            if random.randint(0, 10) > 2:
-                weight = random.randint(1, 10) 
-                graph[i][j] = weight
-            else: #I didn't want all the nodes connected so I added this - this can result in a disconnected graph but there is an else statement for that
-                graph[i][j] = float('inf')
+# Each pair gets an edge 8 times in 11 (like randint(0, 10) > 2) with a weight
+# from 1 to 10. Missing edges are left out rather than stored as float('inf'),
+# so dijkstra never loops over them; this can still disconnect the graph.
+graph = to_dict_graph(*gnp_random_graph(len(nodes), 8 / 11))
 
 # --- Main Execution ---
 if __name__ == "__main__":
@@ -0,0 +1,167 @@
+import math
+import random
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INDEX_TYPE = "q"    # int64 offsets and node ids
+WEIGHT_TYPE = "q"   # int64 weights, like the randint weights of the lab graphs
+
+
+def gnp_random_graph(num_nodes, p, seed=None, low=1, high=10):
+    """
+    Random directed graph G(n, p): every ordered pair of distinct nodes
+    gets an edge with probability p, with a random integer weight.
+
+    Instead of flipping a coin for each of the n(n-1) pairs, the pairs are
+    numbered and the gap to the next edge is drawn directly from the
+    geometric distribution (geometric skipping), so the work is O(V + E)
+    and pairs without an edge are never touched at all.
+
+    Args:
+        num_nodes (int): Number of nodes.
+        p (float): Probability of each edge.
+        seed: Seed for the random generator so graphs are repeatable. A
+              seed gives the same graph each time, but not the same one with
+              and without NumPy.
+        low (int): Smallest edge weight.
+        high (int): Largest edge weight.
+
+    Returns:
+        tuple: (offsets, targets, weights) arrays: the edges out of node u
+               go to targets[offsets[u]:offsets[u + 1]], sorted, with the
+               matching weights.
+    """
+    total = num_nodes * (num_nodes - 1)
+    if p <= 0 or total == 0:
+        return _to_arrays(num_nodes, [], seed, low, high)
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        if p >= 1:
+            pairs = np.arange(total, dtype=np.int64)
+        else:
+            pairs = _geometric_pairs_numpy(rng, total, p)
+        return _to_arrays_numpy(num_nodes, pairs, rng, low, high)
+
+    rng = random.Random(seed)
+    if p >= 1:
+        return _to_arrays(num_nodes, range(total), rng, low, high)
+    pairs = []
+    logQ = math.log(1 - p)
+    pair = -1
+    while True:
+        # 1 - random() is in (0, 1], so the log is always defined
+        pair += 1 + int(math.log(1 - rng.random()) / logQ)
+        if pair >= total:
+            break
+        pairs.append(pair)
+    return _to_arrays(num_nodes, pairs, rng, low, high)
+
+
+def gnm_random_graph(num_nodes, num_edges, seed=None, low=1, high=10):
+    """
+    Random directed graph G(n, m): num_edges distinct ordered pairs of
+    distinct nodes, chosen uniformly, each with a random integer weight.
+    Only the chosen pairs are generated, so the work is O(V + E).
+
+    Args:
+        num_nodes (int): Number of nodes.
+        num_edges (int): Number of edges, at most n(n-1).
+        seed: Seed for the random generator so graphs are repeatable.
+        low (int): Smallest edge weight.
+        high (int): Largest edge weight.
+
+    Returns:
+        tuple: (offsets, targets, weights) arrays, as gnp_random_graph
+               returns them.
+    """
+    total = num_nodes * (num_nodes - 1)
+    if num_edges > total:
+        raise ValueError(f"a directed graph with {num_nodes} nodes has at most {total} edges")
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        pairs = np.sort(rng.choice(total, size=num_edges, replace=False, shuffle=False))
+        return _to_arrays_numpy(num_nodes, pairs.astype(np.int64), rng, low, high)
+    rng = random.Random(seed)
+    # sample() draws from a range without building it
+    pairs = sorted(rng.sample(range(total), num_edges))
+    return _to_arrays(num_nodes, pairs, rng, low, high)
+
+
+def to_dict_graph(offsets, targets, weights):
+    """
+    Converts generated arrays to the dictionary form dijkstra takes, with
+    only the edges that exist.
+
+    Returns:
+        dict: graph[u][v] is the weight of the edge u -> v.
+    """
+    graph = {}
+    for u in range(len(offsets) - 1):
+        start, end = offsets[u], offsets[u + 1]
+        graph[u] = dict(zip(targets[start:end].tolist(), weights[start:end].tolist()))
+    return graph
+
+
+def _geometric_pairs_numpy(rng, total, p):
+    # Gaps between edges are geometric; draw them in batches a bit larger
+    # than the expected edge count, so one batch is nearly always enough
+    expected = total * p
+    batchSize = int(expected + 6 * math.sqrt(expected) + 16)
+    batches = []
+    last = -1
+    while last < total:
+        pairs = last + np.cumsum(rng.geometric(p, size=batchSize))
+        last = int(pairs[-1])
+        batches.append(pairs)
+    pairs = np.concatenate(batches) if len(batches) > 1 else batches[0]
+    return pairs[:np.searchsorted(pairs, total)]
+
+
+def _to_arrays_numpy(num_nodes, pairs, rng, low, high):
+    # Pair index i is the edge u -> v with u = i // (n - 1), skipping v == u
+    sources, rest = np.divmod(pairs, num_nodes - 1)
+    targets = rest + (rest >= sources)
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+    weights = rng.integers(low, high + 1, size=pairs.size, dtype=np.int64)
+    return (array(INDEX_TYPE, offsets.tobytes()),
+            array(INDEX_TYPE, targets.astype(np.int64).tobytes()),
+            array(WEIGHT_TYPE, weights.tobytes()))
+
+
+def _to_arrays(num_nodes, pairs, rng, low, high):
+    if not isinstance(rng, random.Random):
+        rng = random.Random(rng)
+    offsets = array(INDEX_TYPE, [0]) * (num_nodes + 1)
+    targets = array(INDEX_TYPE)
+    weights = array(WEIGHT_TYPE)
+    for pair in pairs:
+        u, rest = divmod(pair, num_nodes - 1)
+        targets.append(rest + (rest >= u))
+        weights.append(rng.randint(low, high))
+        offsets[u + 1] += 1
+    for u in range(num_nodes):
+        offsets[u + 1] += offsets[u]
+    return offsets, targets, weights
+
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    import time
+
+    from lab4ShortestPath import dijkstra
+
+    graph = to_dict_graph(*gnp_random_graph(10, 0.3, seed=1240))
+    print(f"Small G(n, p): {graph}")
+    print(f"Path 0 -> 9: {dijkstra(graph, 0, 9)}")
+
+    for name, make in (("G(n, p)", lambda: gnp_random_graph(1000000, 1e-5, seed=1)),
+                       ("G(n, m)", lambda: gnm_random_graph(1000000, 10000000, seed=1))):
+        startTime = time.perf_counter()
+        offsets, targets, weights = make()
+        print(f"{name}: {len(offsets) - 1} nodes, {len(targets)} edges "
+              f"in {time.perf_counter() - startTime:.2f}s")
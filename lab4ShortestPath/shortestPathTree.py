@@ -0,0 +1,172 @@
+import heapq
+from collections import OrderedDict
+
+
+class ShortestPathTree:
+    """
+    Every shortest path from one source, as found by a full run of
+    Dijkstra's algorithm: the distance to and the predecessor of each
+    reachable node. Once built, any number of targets can be looked up
+    without searching again.
+    """
+
+    def __init__(self, source, distances, predecessors):
+        self.source = source
+        self.distances = distances
+        self.predecessors = predecessors
+
+    def distance_to(self, node):
+        """
+        Returns the cost of the shortest path to node, or float('inf') if
+        it can't be reached.
+        """
+        return self.distances.get(node, float('inf'))
+
+    def path_to(self, node):
+        """
+        Walks the predecessors back from node to the source.
+
+        Args:
+            node: The end node.
+
+        Returns:
+            list: The shortest path from the source to node, or None if no
+                  path exists.
+        """
+        if node not in self.distances:
+            return None
+        path = []
+        current = node
+        while current is not None:
+            path.append(current)
+            current = self.predecessors[current]
+        path.reverse()
+        return path
+
+    def __repr__(self):
+        return f"ShortestPathTree(source={self.source!r}, {len(self.distances)} reachable nodes)"
+
+
+def shortest_path_tree(graph, start_node):
+    """
+    Runs Dijkstra's algorithm from start_node until every reachable node
+    is settled, instead of stopping at one end node like dijkstra does.
+    Relaxations happen in the same order as in dijkstra, so path_to(end)
+    gives the same path dijkstra(graph, start_node, end) finds.
+
+    Args:
+        graph (dict): A dictionary representing the graph where keys are nodes
+                      and values are dictionaries of neighboring nodes and their weights.
+        start_node: The source node.
+
+    Returns:
+        ShortestPathTree: The distances and predecessors from start_node.
+    """
+    inf = float('inf')
+    distances = {start_node: 0}
+    predecessors = {start_node: None}
+    priority_queue = [(0, start_node)]
+
+    while priority_queue:
+        current_cost, current_node = heapq.heappop(priority_queue)
+
+        if current_cost > distances[current_node]:
+            continue
+
+        for neighbor, weight in graph[current_node].items():
+            cost = current_cost + weight
+
+            # float('inf') weights mark missing edges and never get relaxed
+            if cost < distances.get(neighbor, inf):
+                distances[neighbor] = cost
+                predecessors[neighbor] = current_node
+                heapq.heappush(priority_queue, (cost, neighbor))
+
+    return ShortestPathTree(start_node, distances, predecessors)
+
+
+class ShortestPathCache:
+    """
+    A least recently used cache of shortest path trees, keyed by graph,
+    source node and graph version.
+
+    The cache can't see changes made to a graph dict, so callers pass a
+    version number and bump it whenever they change the graph; trees built
+    for an older version are then never returned again and age out.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.trees = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def tree(self, graph, start_node, version=0):
+        """
+        Returns the shortest path tree from start_node, building it only if
+        it isn't cached yet.
+
+        Args:
+            graph (dict): The graph, as for dijkstra.
+            start_node: The source node.
+            version: Anything that changes whenever the graph does.
+
+        Returns:
+            ShortestPathTree: The (possibly cached) tree.
+        """
+        # id(graph) could be reused by a new dict once the old one is gone,
+        # so the entry keeps the graph and is only a hit for that same object
+        key = (id(graph), start_node, version)
+        entry = self.trees.get(key)
+        if entry is not None and entry[0] is graph:
+            self.hits += 1
+            self.trees.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        tree = shortest_path_tree(graph, start_node)
+        self.trees[key] = (graph, tree)
+        self.trees.move_to_end(key)
+        if len(self.trees) > self.maxsize:
+            self.trees.popitem(last=False)
+        return tree
+
+    def shortest_path(self, graph, start_node, end_node, version=0):
+        """
+        Same result as dijkstra(graph, start_node, end_node), answered from
+        the cached tree of start_node.
+
+        Returns:
+            tuple: A tuple containing the shortest path as a list and its total cost.
+                   Returns (None, float('inf')) if no path exists.
+        """
+        tree = self.tree(graph, start_node, version)
+        return tree.path_to(end_node), tree.distance_to(end_node)
+
+    def clear(self):
+        self.trees.clear()
+
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    import time
+
+    from lab4ShortestPath import dijkstra, graph
+
+    cache = ShortestPathCache()
+    for end in range(1, 10):
+        path, cost = cache.shortest_path(graph, 0, end)
+        print(f"0 -> {end}: {path} (cost {cost})")
+    print(f"Cache hits: {cache.hits}, misses: {cache.misses}")
+
+    # Many queries from a few hot sources
+    queries = [(source, end) for source in range(3) for end in range(10)] * 1000
+    startTime = time.perf_counter()
+    for source, end in queries:
+        dijkstra(graph, source, end)
+    dijkstraTime = time.perf_counter() - startTime
+    startTime = time.perf_counter()
+    for source, end in queries:
+        cache.shortest_path(graph, source, end)
+    cacheTime = time.perf_counter() - startTime
+    print(f"{len(queries)} queries: dijkstra {dijkstraTime:.3f}s, cached trees {cacheTime:.3f}s")